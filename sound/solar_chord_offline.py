@@ -19,6 +19,14 @@ except ImportError:
     print("!! This script needs mido:  pip install mido")
     sys.exit(1)
 
+# Stage profiling (SRHF_PROFILE=1) from the v3.0 SRHF engine, when the
+# script runs inside the full repository; a no-op otherwise
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "v3.0", "scripts"))
+try:
+    from srhf.profiling import profiled
+except ImportError:
+    profiled = lambda name: (lambda f: f)
+
 # --- Config ---
 OUTPUT_DIR = "recordings"
 SOUNDFONT = "Arachno.sf2"
@@ -112,6 +120,7 @@ class MidiBuilder:
                                         channel=channel, control=controller,
                                         value=value))
 
+    @profiled("midi.write")
     def write(self, path):
         mid = mido.MidiFile(ticks_per_beat=TICKS_PER_BEAT)
         track = mido.MidiTrack()
@@ -162,6 +171,7 @@ def boosted_velocity(channel, velocity):
 # PRESET → MIDI COMPOSITION
 # =============================================================================
 
+@profiled("midi.compose")
 def compose_preset(choice, program_list):
     """Build a MidiBuilder with all events for this preset, then return it."""
     mb = MidiBuilder()
@@ -256,6 +266,7 @@ def compose_preset(choice, program_list):
 # RENDER
 # =============================================================================
 
+@profiled("midi.fluidsynth")
 def render_midi_to_wav(midi_path, wav_path):
     """Call fluidsynth as a one-shot renderer."""
     cmd = [
@@ -274,6 +285,7 @@ def render_midi_to_wav(midi_path, wav_path):
         return False
     return True
 
+@profiled("midi.mp3")
 def convert_to_mp3(wav_path):
     mp3_path = wav_path.rsplit('.', 1)[0] + '.mp3'
     try:
@@ -0,0 +1,588 @@
+import os
+import struct
+import sys
+import tempfile
+from collections import namedtuple
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# stage profiling (SRHF_PROFILE=1) from the v3.0 SRHF engine, when sound/
+# runs inside the full repository; no-ops otherwise
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "v3.0", "scripts"))
+try:
+    from srhf.profiling import profiled, stage
+except ImportError:
+    profiled = lambda name: (lambda f: f)
+    stage = lambda name: nullcontext()
+
+# =============================================================================
+# SOLAR CHORD SYNTHESIS ENGINE
+# Tone generation, oscillator bank, timeline mixing and streaming WAV
+# output shared by the sound/ scripts
+# =============================================================================
+
+SAMPLE_RATE = 44100   # Hz
+FADE        = 0.15    # seconds for fade in/out
+BLOCK       = 65536   # samples per block when streaming
+HEADROOM    = 0.85    # peak level after normalisation
+
+# =============================================================================
+# TONES — one sine wave with amplitude envelope
+# =============================================================================
+@profiled("sine_wave")
+def sine_wave(freq, duration, amplitude=1.0, sample_rate=SAMPLE_RATE, out=None):
+    """
+    int(sample_rate * duration) samples of a faded sine; written into
+    `out` (same length) when given, so callers can render in place.
+    """
+    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+    np.sin(t * (2 * np.pi * freq), out=t)
+    wave_data = np.multiply(t, amplitude, out=t if out is None else out)
+
+    # Fade in and fade out to avoid clicks
+    fade_samples = int(FADE * sample_rate)
+    fade_in  = np.linspace(0, 1, fade_samples)
+    fade_out = np.linspace(1, 0, fade_samples)
+
+    wave_data[:fade_samples]  *= fade_in
+    wave_data[-fade_samples:] *= fade_out
+
+    return wave_data
+
+# =============================================================================
+# TIMELINE — tones one after another in one preallocated buffer
+# =============================================================================
+# Each segment is a tone followed by `gap` seconds of silence. The total
+# length is known before anything is synthesised, so the buffer is
+# allocated once and every tone is written straight into its slice:
+# linear in the total length for any number of segments (growing the
+# buffer with np.concatenate per tone copies it every time, which is
+# quadratic). The tones come from a one-voice OscillatorBank (below)
+# with the sine_wave() envelope.
+Segment = namedtuple("Segment", ["freq", "duration", "amplitude", "gap"])
+
+
+def sequence_layout(segments, sample_rate=SAMPLE_RATE):
+    """(start sample, tone samples) of each segment and the total length."""
+    layout, pos = [], 0
+    for seg in segments:
+        n = int(sample_rate * seg.duration)
+        layout.append((pos, n))
+        pos += n + int(sample_rate * seg.gap)
+    return layout, pos
+
+
+def tone_blocks(freq, duration, amplitude=1.0, sample_rate=SAMPLE_RATE):
+    """The sine_wave() tone from a one-voice OscillatorBank, block by block."""
+    n = int(sample_rate * duration)
+    envelope = Envelope.tone(0, n, sample_rate=sample_rate)
+    return OscillatorBank(freq, amplitude, [envelope], sample_rate=sample_rate).blocks(n)
+
+
+def render_tone(freq, duration, amplitude=1.0, sample_rate=SAMPLE_RATE, out=None):
+    """tone_blocks() as one array, written into `out` (same length) when given."""
+    out = np.empty(int(sample_rate * duration)) if out is None else out
+    pos = 0
+    for block in tone_blocks(freq, duration, amplitude, sample_rate):
+        out[pos:pos + block.size] = block
+        pos += block.size
+    return out
+
+
+@profiled("render_sequence")
+def render_sequence(segments, sample_rate=SAMPLE_RATE):
+    """All segments rendered back to back into one float64 array."""
+    segments = list(segments)
+    layout, total = sequence_layout(segments, sample_rate)
+    out = np.zeros(total)
+    for seg, (start, n) in zip(segments, layout):
+        render_tone(seg.freq, seg.duration, seg.amplitude, sample_rate, out=out[start:start + n])
+    return out
+
+
+def sequence_blocks(segments, sample_rate=SAMPLE_RATE, block=BLOCK):
+    """The render_sequence() signal as blocks."""
+    for seg in segments:
+        yield from tone_blocks(seg.freq, seg.duration, seg.amplitude, sample_rate)
+        silence = int(sample_rate * seg.gap)
+        for start in range(0, silence, block):
+            yield np.zeros(min(block, silence - start))
+
+
+# =============================================================================
+# OSCILLATOR BANK — many sinusoids, block by block
+# =============================================================================
+# Each voice is a unit phasor z = exp(i*phase). Within a block of B
+# samples its values are z * exp(i*omega*m), m = 0..B-1, read from a
+# rotation table computed once, so a block of the mix is
+#
+#     out[m] = Im( sum_k gain_k * z_k * R[k, m] )
+#
+# a single complex matrix-vector product for voices whose gain is
+# constant over the block, plus an elementwise product for voices inside
+# an envelope ramp. After the block every phasor advances by
+# exp(i*omega*B) and is renormalised to unit length, so rounding never
+# accumulates into amplitude drift; no time vector and no sin() call per
+# sample are needed. Hundreds of voices render many times faster than
+# real time.
+BANK_BLOCK = 4096   # samples per oscillator-bank block
+
+
+class Envelope:
+    """Piecewise-linear gain through (sample, gain) breakpoints."""
+
+    def __init__(self, samples, gains):
+        self.samples = np.asarray(samples, dtype=float)
+        self.gains = np.asarray(gains, dtype=float)
+
+    @classmethod
+    def tone(cls, start, length, amplitude=1.0, fade=None, release=None,
+             sample_rate=SAMPLE_RATE):
+        """
+        Faded tone of `length` samples from `start`: fade in, hold, and
+        fade out over `release` samples (default: the FADE of sine_wave).
+        """
+        fade = int(FADE * sample_rate) if fade is None else fade
+        release = fade if release is None else release
+        end = start + length - 1
+        return cls([start, start + fade - 1, end - release + 1, end],
+                   [0.0, amplitude, amplitude, 0.0])
+
+    @property
+    def span(self):
+        """First and last sample with nonzero gain (inclusive)."""
+        live = np.flatnonzero(self.gains)
+        if live.size == 0:
+            return 0, -1
+        first, last = live[0], live[-1]
+        start = self.samples[first - 1] + 1 if first > 0 else -np.inf
+        stop = self.samples[last + 1] - 1 if last + 1 < self.samples.size else np.inf
+        return start, stop
+
+    def gain(self, start, n):
+        """Gain over samples start..start+n-1: a float if constant, else an array."""
+        i, j = np.searchsorted(self.samples, [start, start + n - 1], side="right")
+        if i == j and (i == 0 or i == self.samples.size or
+                       self.gains[i - 1] == self.gains[i]):
+            return float(self.gains[min(i, self.samples.size - 1)])
+        return np.interp(np.arange(start, start + n), self.samples, self.gains)
+
+
+class OscillatorBank:
+    """N sine voices with fixed frequencies and optional per-voice envelopes."""
+
+    def __init__(self, freqs, amplitudes=1.0, envelopes=None, phases=0.0,
+                 sample_rate=SAMPLE_RATE, block=BANK_BLOCK):
+        self.freqs = np.atleast_1d(np.asarray(freqs, dtype=float))
+        self.amplitudes = np.broadcast_to(np.asarray(amplitudes, dtype=float),
+                                          self.freqs.shape)
+        self.envelopes = list(envelopes) if envelopes is not None else [None] * self.freqs.size
+        self.phases = np.broadcast_to(np.asarray(phases, dtype=float), self.freqs.shape)
+        self.sample_rate = sample_rate
+        self.block = block
+        self.omega = 2 * np.pi * self.freqs / sample_rate
+        # One rotation-table row per distinct frequency; row[k] is voice k's
+        unique, self.row = np.unique(self.freqs, return_inverse=True)
+        if unique.size == self.freqs.size:
+            unique, self.row = self.freqs, np.arange(self.freqs.size)
+        unique_omega = 2 * np.pi * unique / sample_rate
+        self.table = np.exp(1j * np.outer(unique_omega, np.arange(block)))
+        self.advance = np.exp(1j * unique_omega * block)
+        self.z = np.empty(self.freqs.size, dtype=complex)
+        self.reset()
+
+    def reset(self, position=0, voices=None):
+        """Move to sample `position`; restart `voices` (default all) there."""
+        self.position = position
+        voices = slice(None) if voices is None else voices
+        self.z[voices] = np.exp(1j * (self.phases[voices] + self.omega[voices] * position))
+
+    def gains(self, n, voices=None):
+        """(constant gain per voice, {voice: gain array}) for the next n samples."""
+        voices = np.arange(self.freqs.size) if voices is None else voices
+        const = self.amplitudes[voices].copy()
+        ramps = {}
+        for j, k in enumerate(voices):
+            env = self.envelopes[k]
+            if env is None:
+                continue
+            g = env.gain(self.position, n)
+            if np.ndim(g):
+                const[j] = 0.0
+                ramps[k] = self.amplitudes[k] * g
+            else:
+                const[j] *= g
+        return const, ramps
+
+    def render(self, n=None, voices=None):
+        """
+        The next n (<= block) samples of the mix of `voices` (default all).
+        Voices left out keep their phasor; reset() them before they rejoin.
+        """
+        n = self.block if n is None else n
+        const, ramps = self.gains(n, voices)
+        if voices is None and self.table.shape[0] == self.freqs.size:
+            voices, rows, table = slice(None), self.row, self.table[:, :n]
+        else:
+            voices = np.arange(self.freqs.size) if voices is None else voices
+            rows = self.row[voices]
+            table = self.table[rows, :n]
+        z = self.z[voices]
+        out = ((const * z) @ table).imag
+        for k, g in ramps.items():
+            out += g * (self.z[k] * self.table[self.row[k], :n]).imag
+        z *= self.advance[rows] if n == self.block else np.exp(1j * self.omega[voices] * n)
+        self.z[voices] = z / np.abs(z)
+        self.position += n
+        return out
+
+    def blocks(self, total, start=0):
+        """Samples start..start+total-1 of the mix, one block at a time."""
+        self.reset(start)
+        for done in range(0, total, self.block):
+            yield self.render(min(self.block, total - done))
+
+# =============================================================================
+# TIMELINE MIXER — voices that sound only over their active span
+# =============================================================================
+# An arrangement is a list of Span descriptors, each one voice: entry
+# time, linear attack, hold at full level, linear release (seconds). A
+# voice exists only from its entry to the end of its release; each block
+# of the mix sums just the spans overlapping it, so silence costs
+# nothing and work and memory scale with the sounding material rather
+# than with (voices x total length).
+#
+# The voices are one OscillatorBank; each block renders only the active
+# spans through it. A voice's phasor is restarted from the absolute
+# sample position when it enters a block after being silent, so any
+# range of the timeline can be rendered on its own (render_into) with the
+# same result.
+Span = namedtuple("Span", ["freq", "amplitude", "entry", "hold", "attack", "release", "phase"],
+                  defaults=(FADE, FADE, None))
+Span.__doc__ = """
+One voice of a Timeline: frequency (Hz), amplitude, entry time and hold
+duration (s), attack and release durations (s, default FADE), and the
+phase at the entry (default 0).
+"""
+
+
+class Timeline:
+    """Sparse mixer of Span voices."""
+
+    def __init__(self, spans, sample_rate=SAMPLE_RATE, block=BANK_BLOCK):
+        self.spans = list(spans)
+        self.sample_rate = sample_rate
+        self.block = block
+        sr = sample_rate
+        self.envelopes = []
+        for span in self.spans:
+            start = int(span.entry * sr)
+            attack = max(int(span.attack * sr), 1)
+            release_start = start + int((span.attack + span.hold) * sr)
+            release = max(int(span.release * sr), 1)
+            self.envelopes.append(Envelope(
+                [start, start + attack - 1, release_start, release_start + release - 1],
+                [0.0, 1.0, 1.0, 0.0]))
+        self.starts = np.array([env.samples[0] for env in self.envelopes], dtype=np.int64)
+        self.ends = np.array([env.samples[-1] + 1 for env in self.envelopes], dtype=np.int64)
+        self.length = int(self.ends.max(initial=0))
+
+        freqs = [span.freq for span in self.spans]
+        amplitudes = [span.amplitude for span in self.spans]
+        # Phase at sample 0 that gives the span's phase at its entry
+        phases = np.array([0.0 if span.phase is None else span.phase for span in self.spans])
+        phases -= 2 * np.pi * np.array(freqs, dtype=float) / sr * self.starts
+        self.bank = OscillatorBank(freqs, amplitudes, self.envelopes, phases, sr, block)
+
+    def voice_samples(self):
+        """Samples synthesised in total (sum of the span lengths)."""
+        return int((self.ends - self.starts).sum())
+
+    def render_into(self, out, start=0):
+        """Add samples start..start+len(out)-1 of the mix into `out`."""
+        live = np.zeros(len(self.spans), dtype=bool)
+        stop = start + len(out)
+        for b0 in range(start, stop, self.block):
+            n = min(self.block, stop - b0)
+            active = (self.starts < b0 + n) & (self.ends > b0)
+            self.bank.reset(b0, np.flatnonzero(active & ~live))
+            live = active
+            if active.any():
+                out[b0 - start:b0 - start + n] += self.bank.render(n, np.flatnonzero(active))
+        return out
+
+    def blocks(self, total=None, block=BLOCK):
+        """The mix (default: to the end of the last span) as blocks."""
+        total = self.length if total is None else total
+        for start in range(0, total, block):
+            yield self.render_into(np.zeros(min(block, total - start)), start)
+
+# =============================================================================
+# PARALLEL RENDERING — a Timeline split across processes
+# =============================================================================
+# The mix is rendered one window at a time into a shared-memory buffer
+# (multiprocessing.shared_memory). Each worker builds its Timeline once
+# from the span list and writes straight into the buffer, so tasks and
+# results are a few integers and no sample array is ever pickled.
+#
+#   by="time"    the window is cut into block-aligned ranges that the
+#                workers render side by side (render_into is exact for
+#                any range); the ranges are disjoint, no reduction
+#   by="voice"   the spans are split into one group per worker, balanced
+#                by length; each group renders the whole window into its
+#                own row, and the rows are summed at the end
+#
+# Only one window is held at a time, so long renders stay bounded in
+# memory. Pass the blocks to write_stream() as an iterable (not a
+# callable) so the mix is spooled once instead of rendered twice.
+# $SRHF_AUDIO_WORKERS sets the default worker count of mix_blocks()
+# (1 = serial, in-process).
+PARALLEL_WINDOW = 1 << 20   # samples per shared-memory window (~24 s)
+
+_WORKER = {}
+
+
+def _init_render_worker(spans, groups, shm_name, shape, sample_rate, block):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _WORKER.update(shm=shm, out=np.ndarray(shape, dtype=float, buffer=shm.buf),
+                   timelines=[Timeline([spans[k] for k in group], sample_rate, block)
+                              for group in groups])
+
+
+def _render_task(group, row, lo, hi, start):
+    _WORKER["timelines"][group].render_into(_WORKER["out"][row, lo:hi], start)
+
+
+def _voice_groups(timeline, n):
+    """Span indices in n groups of similar total length (longest first)."""
+    groups, load = [[] for _ in range(n)], np.zeros(n)
+    lengths = timeline.ends - timeline.starts
+    for k in np.argsort(-lengths, kind="stable"):
+        g = int(np.argmin(load))
+        groups[g].append(int(k))
+        load[g] += lengths[k]
+    return [group for group in groups if group]
+
+
+@profiled("parallel_blocks")
+def parallel_blocks(spans, total=None, workers=None, by="time", window=PARALLEL_WINDOW,
+                    sample_rate=SAMPLE_RATE, block=BANK_BLOCK):
+    """The Timeline mix of `spans` rendered by a process pool, one window per block."""
+    if by not in ("time", "voice"):
+        raise ValueError(f"Unknown split: {by!r}")
+    spans = list(spans)
+    timeline = Timeline(spans, sample_rate, block)
+    total = timeline.length if total is None else total
+    workers = workers or os.cpu_count() or 1
+    window = min(window, max(total, 1))
+    groups = _voice_groups(timeline, workers) if by == "voice" else [list(range(len(spans)))]
+    shape = (len(groups) if by == "voice" else 1, window)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(8 * shape[0] * shape[1], 1))
+    try:
+        out = np.ndarray(shape, dtype=float, buffer=shm.buf)
+        with ProcessPoolExecutor(workers, initializer=_init_render_worker,
+                                 initargs=(spans, groups, shm.name, shape, sample_rate,
+                                           block)) as pool:
+            for w0 in range(0, total, window):
+                n = min(window, total - w0)
+                out[:, :n] = 0.0
+                if by == "voice":
+                    tasks = [(g, g, 0, n, w0) for g in range(len(groups))]
+                else:
+                    # A few ranges per worker for load balance, block-aligned
+                    step = max(block, -(-n // (4 * workers * block)) * block)
+                    tasks = [(0, 0, lo, min(lo + step, n), w0 + lo) for lo in range(0, n, step)]
+                list(pool.map(_render_task, *zip(*tasks)))
+                yield out[:, :n].sum(axis=0) if by == "voice" else out[0, :n].copy()
+        del out
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def render_parallel(spans, total=None, workers=None, by="time"):
+    """The whole Timeline mix as one array, rendered by a process pool."""
+    return np.concatenate(list(parallel_blocks(spans, total, workers, by)) or [np.zeros(0)])
+
+
+def mix_blocks(spans, total=None, workers=None):
+    """Timeline mix as blocks: serial, or parallel when workers > 1."""
+    workers = workers or int(os.environ.get("SRHF_AUDIO_WORKERS", "1"))
+    if workers > 1:
+        return parallel_blocks(spans, total, workers)
+    return Timeline(spans).blocks(total)
+
+
+def fade_out_blocks(blocks, total, sample_rate=SAMPLE_RATE):
+    """
+    `blocks` (a stream of `total` samples) with the last FADE faded out
+    linearly, as sine_wave() ends a tone; on a mix whose voices all ring
+    to the end this equals fading each voice.
+    """
+    ramp = np.linspace(1, 0, int(FADE * sample_rate))
+    fade_start = total - ramp.size
+    pos = 0
+    for block in blocks:
+        lo = max(fade_start - pos, 0)
+        if lo < len(block):
+            block[lo:] *= ramp[pos + lo - fade_start:pos + len(block) - fade_start]
+        pos += len(block)
+        yield block
+
+# =============================================================================
+# OUTPUT — streaming WAV writer
+# =============================================================================
+# WavWriter takes float blocks in [-1, 1] and appends them to the file as
+# 16-bit or 24-bit PCM or 32-bit float frames; the RIFF sizes are patched
+# in on close. Memory is one block, whatever the length of the render.
+#
+# write_stream() normalises while it writes, so the peak has to be known
+# before the first frame. It can be
+#
+#   - given as `peak` (e.g. an analytic bound such as the sum of the
+#     voice amplitudes);
+#   - measured in a first pass, when `blocks` is a callable returning a
+#     fresh block iterator (cheap signals: synthesised twice, never held
+#     in memory);
+#   - measured while spooling, when `blocks` is a plain iterable: the
+#     blocks are synthesised once, written to a temporary float64 file
+#     and read back for the normalised pass (expensive signals such as
+#     parallel_blocks(): one render, memory still one block).
+
+# sample format -> (bytes per sample, WAV format tag, full scale)
+SAMPLE_FORMATS = {
+    "int16":   (2, 1, 32767),
+    "int24":   (3, 1, 8388607),
+    "float32": (4, 3, 1.0),
+}
+
+
+class WavWriter:
+    """Incremental WAV file writer (use as a context manager)."""
+
+    def __init__(self, path, sample_rate=SAMPLE_RATE, sample_format="int16", channels=1):
+        try:
+            self.width, self.tag, self.scale = SAMPLE_FORMATS[sample_format]
+        except KeyError:
+            raise ValueError(f"Unknown sample format: {sample_format!r}") from None
+        self.sample_format = sample_format
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.frames = 0
+        self.fh = open(path, "wb")
+        self._header()
+
+    def _header(self):
+        data_bytes = self.frames * self.channels * self.width
+        block_align = self.channels * self.width
+        fmt = struct.pack("<HHIIHH", self.tag, self.channels, self.sample_rate,
+                          self.sample_rate * block_align, block_align, 8 * self.width)
+        if self.tag == 3:
+            # IEEE float: extended fmt chunk and a fact chunk (frame count)
+            fmt += struct.pack("<H", 0)
+            chunks = (b"fmt " + struct.pack("<I", len(fmt)) + fmt
+                      + b"fact" + struct.pack("<II", 4, self.frames))
+        else:
+            chunks = b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        self.fh.seek(0)
+        self.fh.write(b"RIFF" + struct.pack("<I", 4 + len(chunks) + 8 + data_bytes) + b"WAVE"
+                      + chunks + b"data" + struct.pack("<I", data_bytes))
+
+    def write(self, block):
+        """Append float samples (interleaved if several channels)."""
+        block = np.asarray(block).reshape(-1)
+        if self.sample_format == "float32":
+            frames = block.astype("<f4")
+        else:
+            # saturate rather than wrap around if a given peak was too small
+            scaled = np.clip(block, -1, 1) * self.scale
+            if self.sample_format == "int16":
+                frames = scaled.astype("<i2")
+            else:
+                # 24-bit: the low three bytes of each little-endian int32
+                frames = scaled.astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3]
+        self.fh.write(frames.tobytes())
+        self.frames += block.size // self.channels
+
+    def close(self):
+        if not self.fh.closed:
+            self._header()
+            self.fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def peak_of(blocks):
+    """Largest |sample| over an iterable of blocks."""
+    peak = 0.0
+    for block in blocks:
+        if len(block):
+            peak = max(peak, float(np.max(block)), -float(np.min(block)))
+    return peak
+
+
+@profiled("write_stream")
+def write_stream(path, blocks, sample_rate=SAMPLE_RATE, sample_format="int16",
+                 peak=None, headroom=HEADROOM, channels=1):
+    """
+    Write float blocks to a WAV file, scaled so the peak sits at
+    `headroom`. Returns the number of frames written.
+    """
+    spool = None
+    if peak is None and not callable(blocks):
+        spool = tempfile.TemporaryFile()
+        with stage("write_stream.spool"):
+            peak = _spool(blocks, spool)
+        blocks = _read_spool(spool)
+    elif peak is None:
+        with stage("write_stream.peak"):
+            peak = peak_of(blocks())
+    try:
+        with WavWriter(path, sample_rate, sample_format, channels) as wf:
+            for block in (blocks() if callable(blocks) else blocks):
+                # Same rounding as normalising the whole array at once
+                wf.write(block / peak * headroom if peak > 0 else block)
+    finally:
+        if spool is not None:
+            spool.close()
+    return wf.frames
+
+
+def _spool(blocks, fh):
+    """Write float64 blocks to fh; returns their peak and rewinds fh."""
+    peak = 0.0
+    for block in blocks:
+        block = np.asarray(block, dtype=float)
+        fh.write(block.tobytes())
+        peak = max(peak, peak_of([block]))
+    fh.seek(0)
+    return peak
+
+
+def _read_spool(fh, block=BLOCK):
+    while True:
+        data = fh.read(8 * block)
+        if not data:
+            return
+        yield np.frombuffer(data, dtype=float)
+
+
+def array_blocks(data, block=BLOCK):
+    """Consecutive views of `data`, `block` samples each."""
+    return (data[start:start + block] for start in range(0, len(data), block))
+
+
+@profiled("write_wav")
+def write_wav(filename, data, sample_rate=SAMPLE_RATE, sample_format="int16"):
+    """Normalise an in-memory signal and write it block by block."""
+    write_stream(filename, lambda: array_blocks(data), sample_rate, sample_format)
+    print(f"  Saved: {filename}")
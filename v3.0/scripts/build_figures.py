@@ -0,0 +1,250 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Build all v3.0 figures in one process
+# Usage: python build_figures.py [--out DIR] [--workers N] [--force]
+#                                [--formats SPECS] [--data DIR] [--profile]
+#                                [--verbose]
+#                                [figure ...]
+# =====================================================
+#
+# Every figure script exposes main(out_dir) and returns its output
+# paths. The builder imports them as modules instead of launching one
+# interpreter per script, so matplotlib, the font cache and the srhf
+# package are loaded once per worker. The shared sweeps are computed
+# once up front into the on-disk cache and read back as memory maps by
+# every figure that needs them.
+#
+# A figure is skipped when the hash of its script and of the srhf
+# package matches the last build recorded in <out>/.build_manifest.json
+# and its outputs still exist. Independent figures render in a process
+# pool in headless mode (Agg backend, see srhf/plotting.py); wall time
+# is reported per figure.
+#
+# --formats (e.g. "png@300,png@150,webp@thumb,pdf,svg"; see
+# srhf/export.py) selects the output formats. Each figure is drawn once
+# for all raster formats, and the per-format export times are written to
+# <out>/export_timings.csv. --data DIR also writes the numbers behind
+# each figure as Parquet/CSV tables (see srhf/data.py). --profile
+# records the named stages of every figure (srhf/profiling.py) and
+# writes one trace for the whole build to <out>/build_trace.json.
+#
+# Figures go to v3.0/build/figures by default. The committed figures in
+# v3.0/figures are only overwritten on request (--out ../figures), so a
+# build never changes the published PNGs by accident.
+#
+# The shared style (srhf/style.py) is loaded in the parent before the
+# pool starts, so forked workers inherit the fonts, the mathtext grammar
+# and the cached layout of the recurring labels.
+
+import argparse
+import contextlib
+import hashlib
+import importlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+DEFAULT_OUT = HERE.parent / "build" / "figures"
+PUBLISHED = HERE.parent / "figures"
+MANIFEST = ".build_manifest.json"
+TIMING_REPORT = "export_timings.csv"
+TRACE = "build_trace.json"
+
+FIGURES = (
+    "srhf_harmonia_orbit",
+    "srhf_harmonia_optimisation",
+    "srhf_rmse_hsi_basin",
+    "srhf_residuals_comparison",
+    "srhf_hsi_values",
+    "srhf_residuals_log",
+    "srhf_residuals_symlog",
+    "srhf_ratios_full",
+    "srhf_ratios_zoom",
+    "srhf_percent_deviation",
+    "srhf_log_validation",
+)
+
+
+def fingerprint(name):
+    """SHA-256 of a figure script and the srhf package sources."""
+    h = hashlib.sha256((HERE / f"{name}.py").read_bytes())
+    for path in sorted((HERE / "srhf").glob("*.py")):
+        h.update(path.name.encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def catalog_fingerprint():
+    """Path, size and mtime of the asteroid catalog (srhf/catalog.py), or None."""
+    from srhf.catalog import catalog_path
+
+    path = catalog_path()
+    if path is None:
+        return None
+    stat = path.stat()
+    return [str(path.resolve()), stat.st_size, stat.st_mtime_ns]
+
+
+def precompute():
+    """Fill the sweep cache once for all figures."""
+    from srhf import sweep, adaptive_sweep
+
+    sweep(2.12, 2.18, 1000)
+    sweep(2.12, 2.16, 2000)
+    adaptive_sweep(2.12, 2.18, tol=1e-4, yscale="log")
+    adaptive_sweep(2.12, 2.18, tol=1e-4, yscale="symlog", linthresh=0.05)
+
+
+def preload_style():
+    """Load fonts and the recurring mathtext labels before the workers fork."""
+    from srhf import style
+    from srhf.plotting import headless
+
+    headless()
+    style.use(rc=False)
+
+
+def _init_worker(profile=False):
+    from srhf.plotting import headless
+    headless()
+    if profile:
+        from srhf import profiling
+        profiling.enable(write_at_exit=False)
+
+
+def _render(name, out_dir, formats, data_dir):
+    import matplotlib.pyplot as plt
+    from srhf import export, profiling
+
+    os.environ["SRHF_FORMATS"] = formats
+    if data_dir:
+        os.environ["SRHF_DATA_DIR"] = data_dir
+    else:
+        os.environ.pop("SRHF_DATA_DIR", None)
+    del export.TIMINGS[:]
+    module = importlib.import_module(name)
+    log = io.StringIO()
+    start = time.perf_counter()
+    with plt.rc_context(), contextlib.redirect_stdout(log):
+        paths = module.main(out_dir)
+    plt.close("all")
+    return (name, paths, time.perf_counter() - start, log.getvalue(), list(export.TIMINGS),
+            profiling.events(reset=True))
+
+
+def build(figures=FIGURES, out_dir=DEFAULT_OUT, workers=None, force=False, verbose=False,
+          formats=None, data_dir=None, profile=False):
+    """
+    Render the given figures into out_dir, skipping unchanged ones.
+
+    Returns {figure: (status, seconds, paths)} with status "built" or
+    "skipped".
+    """
+    from srhf.export import parse_formats, write_timing_report
+
+    formats = formats or os.environ.get("SRHF_FORMATS") or "png@300"
+    parse_formats(formats)   # fail early on a bad spec
+    data_dir = str(Path(data_dir).resolve()) if data_dir else None
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+
+    hashes = {name: fingerprint(name) for name in figures}
+    catalog = catalog_fingerprint()
+    todo, report = [], {}
+    for name in figures:
+        entry = manifest.get(name)
+        if (not force and entry and entry["hash"] == hashes[name]
+                and entry.get("formats") == formats
+                and entry.get("data") == data_dir
+                and entry.get("catalog") == catalog
+                and all(Path(p).exists() for p in entry["outputs"])):
+            report[name] = ("skipped", 0.0, entry["outputs"])
+        else:
+            todo.append(name)
+
+    if profile:
+        from srhf import profiling
+        profiling.enable(write_at_exit=False)
+    if todo:
+        precompute()
+        preload_style()
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(todo)) or 1
+
+    if workers > 1:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(profile,)) as pool:
+            results = list(pool.map(_render, todo, [str(out_dir)] * len(todo),
+                                    [formats] * len(todo), [data_dir] * len(todo)))
+    else:
+        _init_worker(profile)
+        results = [_render(name, str(out_dir), formats, data_dir) for name in todo]
+
+    timings, stages = [], {}
+    for name, paths, seconds, log, rows, evts in results:
+        report[name] = ("built", seconds, paths)
+        manifest[name] = {"hash": hashes[name], "formats": formats, "data": data_dir,
+                          "catalog": catalog,
+                          "outputs": paths, "seconds": seconds}
+        timings.extend(rows)
+        stages[name] = evts
+        if verbose and log:
+            print(f"--- {name} ---\n{log}")
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    if timings:
+        write_timing_report(out_dir / TIMING_REPORT, timings)
+    if profile:
+        from srhf import profiling
+        runs = {"build_figures": profiling.events(reset=True), **stages}
+        profiling.write_trace(out_dir / TRACE, runs)
+        profiling.print_summary([e for evts in runs.values() for e in evts], file=sys.stdout)
+        print(f"Profile trace: {out_dir / TRACE}")
+    return {name: report[name] for name in figures}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the SRHF v3.0 figures.")
+    parser.add_argument("figures", nargs="*", default=FIGURES, help="figure scripts (default: all)")
+    parser.add_argument("--out", default=DEFAULT_OUT,
+                        help=f"output directory (default: {DEFAULT_OUT.relative_to(HERE.parent.parent)}; "
+                             f"pass {PUBLISHED.relative_to(HERE.parent.parent)} to publish)")
+    parser.add_argument("--workers", type=int, default=None, help="process-pool size")
+    parser.add_argument("--force", action="store_true", help="rebuild unchanged figures")
+    parser.add_argument("--formats", default=None,
+                        help='comma-separated output formats, e.g. "png@300,webp@thumb,pdf"')
+    parser.add_argument("--data", default=None,
+                        help="also write each figure's data tables into this directory")
+    parser.add_argument("--profile", action="store_true",
+                        help=f"record stage timings and write <out>/{TRACE}")
+    parser.add_argument("--verbose", action="store_true", help="show console summaries")
+    args = parser.parse_args(argv)
+
+    unknown = [f for f in args.figures if f not in FIGURES]
+    if unknown:
+        parser.error(f"unknown figure(s): {', '.join(unknown)}")
+
+    start = time.perf_counter()
+    try:
+        report = build(args.figures, args.out, args.workers, args.force, args.verbose,
+                       args.formats, args.data, args.profile)
+    except ValueError as exc:
+        parser.error(str(exc))
+    total = time.perf_counter() - start
+
+    print(f"\n{'Figure':<30} {'Status':<8} {'Time (s)':>9}")
+    print("-" * 49)
+    for name, (status, seconds, _) in report.items():
+        print(f"{name:<30} {status:<8} {seconds:9.2f}")
+    print("-" * 49)
+    print(f"{'Total wall time':<39} {total:9.2f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Startup / import-time budget check
+# Usage: python check_import_budget.py [--runs N]
+# =====================================================
+#
+# Each entry point is started in a fresh interpreter `runs` times. numpy
+# itself is the floor for every numbers-only run (~0.1 s), so the budget
+# applies to the median wall time above a bare `python -c "import numpy"`.
+# The entry points must also not load any of the heavy modules
+# (matplotlib, scipy, sympy, process pools). Exits with status 1 if any
+# budget is exceeded or a heavy module was loaded.
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+ROOT_SCRIPTS = HERE.parent.parent / "scripts"
+
+HEAVY = ("matplotlib", "scipy", "sympy", "concurrent.futures")
+
+# Ensures the heavy modules stay unloaded after running `code`
+_PROBE = ("import sys; {code}; "
+          "bad = [m for m in {heavy!r} if m in sys.modules]; "
+          "sys.exit(f'loaded: {{bad}}' if bad else 0)")
+
+# (label, argv after the interpreter, budget in ms above `import numpy`)
+BUDGETS = (
+    ("import srhf", ["-c", _PROBE.format(code="import srhf", heavy=HEAVY)], 30),
+    ("from srhf import rmse_optimum",
+     ["-c", _PROBE.format(code="from srhf import rmse_optimum; rmse_optimum()", heavy=HEAVY)], 30),
+    ("from srhf.plotting import plt",
+     ["-c", _PROBE.format(code="from srhf.plotting import plt", heavy=HEAVY)], 30),
+    ("srhf_hsi_values.py --no-plot", [str(HERE / "srhf_hsi_values.py"), "--no-plot"], 50),
+    ("celtic_mape_optimization.py", [str(ROOT_SCRIPTS / "celtic_mape_optimization.py")], 50),
+)
+
+
+def wall_ms(argv, runs):
+    """Median wall time (ms) of `python argv` in a fresh interpreter."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable, *argv], cwd=HERE,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        times.append((time.perf_counter() - start) * 1e3)
+        if proc.returncode:
+            return None, proc.stderr.strip().splitlines()[-1]
+    return statistics.median(times), ""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check SRHF startup time budgets.")
+    parser.add_argument("--runs", type=int, default=7, help="runs per entry point")
+    args = parser.parse_args(argv)
+
+    bare, _ = wall_ms(["-c", "pass"], args.runs)
+    floor, _ = wall_ms(["-c", "import numpy"], args.runs)
+    print(f"Bare interpreter: {bare:.0f} ms, import numpy: {floor - bare:.0f} ms more\n")
+    print(f"{'Entry point':<32} {'Total':>7} {'+numpy':>7} {'Budget':>7}  Status")
+    print("-" * 68)
+
+    failed = False
+    for label, cmd, budget in BUDGETS:
+        ms, error = wall_ms(cmd, args.runs)
+        if ms is None:
+            print(f"{label:<32} {'-':>7} {'-':>7} {budget:>7}  FAIL ({error})")
+            failed = True
+            continue
+        over = ms - floor
+        status = "ok" if over <= budget else "OVER"
+        failed |= status == "OVER"
+        print(f"{label:<32} {ms - bare:7.0f} {over:7.0f} {budget:>7}  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
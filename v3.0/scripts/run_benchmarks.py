@@ -0,0 +1,326 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Benchmarks for the numeric, audio and MIDI hot paths
+# Usage: python run_benchmarks.py [--quick] [-k FILTER] [--json PATH]
+#                                 [--save-baseline] [--threshold X]
+# =====================================================
+#
+# Every case has a fixed size and fixed seed, so runs are comparable
+# across commits:
+#
+#   sweep      predict_outer / rmse / hsi over 10^3 .. 10^7 a_H values
+#   optimum    scipy minimize_scalar versus the closed-form rmse_optimum,
+#              single system and a batch of perturbed systems
+#   audio      sine_wave, write_wav, sequential rendering of 1000 tones,
+#              a streamed 10-minute WAV, the oscillator bank at 10 and
+#              300 voices and a 10-minute timeline of 1000 short spans
+#              (sound/synth.py)
+#   midi       compose_preset and MidiBuilder.write from
+#              sound/solar_chord_offline.py (skipped without mido)
+#
+# Each case is timed as the best of `repeat` runs, after a warm-up run,
+# and reported as time per call, throughput (items/s) and peak traced
+# memory (tracemalloc, which also sees numpy buffers) in a separate run.
+#
+# Results are compared with benchmarks_baseline.json; a case that is
+# more than `threshold` times slower than its baseline is a regression
+# and the exit status is 1. So is a case with no baseline entry, and a
+# baselined case that was skipped because its dependency is missing, so
+# an unmeasured path can never pass silently. --save-baseline records
+# the current run.
+# Baselines are machine-specific: the file stores the platform it was
+# recorded on, and a mismatch is reported with the comparison.
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+HERE = Path(__file__).resolve().parent
+SOUND = HERE.parent.parent / "sound"
+BASELINE = HERE / "benchmarks_baseline.json"
+
+SEED = 2026
+SWEEP_SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+QUICK_MAX = 10**6
+
+
+# =====================================================
+# Cases: each setup returns (callable, items per call)
+# =====================================================
+
+def _sweep(metric, n):
+    from srhf import predict_outer, rmse, hsi
+
+    func = {"predict_outer": predict_outer, "rmse": rmse, "hsi": hsi}[metric]
+    a_range = np.linspace(2.12, 2.18, n)
+    return lambda: func(a_range), n
+
+
+def _perturbed(n):
+    from srhf import OUTER_OBSERVED, ROUNDING_SIGMA
+
+    rng = np.random.default_rng(SEED)
+    return OUTER_OBSERVED + rng.normal(0.0, ROUNDING_SIGMA, (n, OUTER_OBSERVED.size))
+
+
+def _minimize_scalar(n):
+    from scipy.optimize import minimize_scalar
+    from srhf import rmse
+
+    systems = _perturbed(n)
+
+    def run():
+        return [minimize_scalar(lambda a: rmse(a, obs), bounds=(2.12, 2.18),
+                                method="bounded", options={"xatol": 1e-12}).x
+                for obs in systems]
+    return run, n
+
+
+def _closed_form(n):
+    from srhf import rmse_optimum
+
+    systems = _perturbed(n)
+    return lambda: rmse_optimum(systems).a_H, n
+
+
+def _sound_module(name):
+    if str(SOUND) not in sys.path:
+        sys.path.insert(0, str(SOUND))
+    return __import__(name)
+
+
+def _sine_wave(seconds):
+    synth = _sound_module("synth")
+    return lambda: synth.sine_wave(540, seconds, amplitude=0.7), int(synth.SAMPLE_RATE * seconds)
+
+
+def _render_sequence(n):
+    synth = _sound_module("synth")
+    segments = [synth.Segment(90 + 9 * k, 0.2, 0.7, 0.05) for k in range(n)]
+    return lambda: synth.render_sequence(segments), synth.sequence_layout(segments)[1]
+
+
+def _write_wav(seconds):
+    synth = _sound_module("synth")
+    data = synth.sine_wave(540, seconds, amplitude=0.7)
+    path = os.path.join(tempfile.mkdtemp(prefix="srhf_bench_"), "bench.wav")
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            synth.write_wav(path, data)
+    return run, data.size
+
+
+def _write_stream(seconds):
+    synth = _sound_module("synth")
+    segments = [synth.Segment(252, 5.0, 0.7, 1.0)] * int(seconds / 6)
+    path = os.path.join(tempfile.mkdtemp(prefix="srhf_bench_"), "bench.wav")
+    frames = synth.sequence_layout(segments)[1]
+    return lambda: synth.write_stream(path, synth.sequence_blocks(segments), peak=0.7), frames
+
+
+def _oscillator_bank(voices):
+    synth = _sound_module("synth")
+    bank = synth.OscillatorBank(np.geomspace(90, 9972, voices), 1.0 / voices)
+    samples = 10 * synth.SAMPLE_RATE
+    return lambda: sum(block.size for block in bank.blocks(samples)), samples * voices
+
+
+def _timeline(n):
+    synth = _sound_module("synth")
+    rng = np.random.default_rng(SEED)
+    spans = [synth.Span(f, 0.2, entry, hold=1.5) for f, entry in
+             zip(rng.choice([90, 180, 252, 396, 540, 1305], n), rng.uniform(0, 600, n))]
+    timeline = synth.Timeline(spans)
+    return lambda: sum(block.size for block in timeline.blocks()), timeline.voice_samples()
+
+
+def _timeline_parallel(voices):
+    # 10-minute mix of sustained voices, split over all cores by time range
+    synth = _sound_module("synth")
+    spans = [synth.Span(f, 1.0 / voices, 0.0, hold=600.0)
+             for f in np.geomspace(90, 9972, voices)]
+    samples = synth.Timeline(spans).voice_samples()
+    return lambda: sum(block.size for block in synth.parallel_blocks(spans)), samples
+
+
+def _compose_preset(_):
+    off = _sound_module("solar_chord_offline")
+
+    def run():
+        return sum(len(off.compose_preset(choice, progs)[0].events)
+                   for choice, (_, progs) in off.PRESETS.items())
+    return run, sum(len(off.compose_preset(c, p)[0].events) for c, (_, p) in off.PRESETS.items())
+
+
+def _midi_write(_):
+    off = _sound_module("solar_chord_offline")
+    mb, _ = off.compose_preset(1, off.PRESETS[1][1])
+    path = os.path.join(tempfile.mkdtemp(prefix="srhf_bench_"), "bench.mid")
+    return lambda: mb.write(path), len(mb.events)
+
+
+def _have(module):
+    import importlib.util
+    return importlib.util.find_spec(module) is not None
+
+
+# (name, group, setup, size, unit, required module or None)
+CASES = (
+    *((f"{metric}[{n:.0e}]", "sweep", lambda n, m=metric: _sweep(m, n), n, "a_H", None)
+      for metric in ("predict_outer", "rmse", "hsi") for n in SWEEP_SIZES),
+    ("minimize_scalar[1]", "optimum", _minimize_scalar, 1, "systems", "scipy"),
+    ("rmse_optimum[1]", "optimum", _closed_form, 1, "systems", None),
+    ("minimize_scalar[100]", "optimum", _minimize_scalar, 100, "systems", "scipy"),
+    ("rmse_optimum[1e+04]", "optimum", _closed_form, 10**4, "systems", None),
+    ("sine_wave[5s]", "audio", _sine_wave, 5.0, "samples", None),
+    ("sine_wave[60s]", "audio", _sine_wave, 60.0, "samples", None),
+    ("render_sequence[1000]", "audio", _render_sequence, 1000, "samples", None),
+    ("write_wav[60s]", "audio", _write_wav, 60.0, "samples", None),
+    ("write_stream[600s]", "audio", _write_stream, 600.0, "samples", None),
+    ("oscillator_bank[10]", "audio", _oscillator_bank, 10, "voice-samples", None),
+    ("oscillator_bank[300]", "audio", _oscillator_bank, 300, "voice-samples", None),
+    ("timeline[1000 spans]", "audio", _timeline, 1000, "voice-samples", None),
+    ("timeline_parallel[10 voices, 600s]", "audio", _timeline_parallel, 10, "voice-samples",
+     None),
+    ("compose_preset[all]", "midi", _compose_preset, None, "events", "mido"),
+    ("MidiBuilder.write[1]", "midi", _midi_write, None, "events", "mido"),
+)
+
+
+# =====================================================
+# Measurement
+# =====================================================
+
+def measure(func, repeat, min_time=0.2):
+    """Best seconds per call over `repeat` rounds of enough calls to last min_time."""
+    func()                                   # warm-up (imports, caches)
+    start = time.perf_counter()
+    func()
+    once = time.perf_counter() - start
+    number = max(1, int(min_time / once)) if once > 0 else 1000
+    best = once
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def peak_memory(func):
+    """Peak bytes allocated (tracemalloc) during one call."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(cases, repeat):
+    results = {}
+    for name, group, setup, size, unit, _ in cases:
+        func, items = setup(size)
+        seconds = measure(func, repeat)
+        results[name] = {"group": group, "seconds": seconds, "items": items, "unit": unit,
+                         "throughput": items / seconds, "peak_bytes": peak_memory(func)}
+        print(f"{name:<24} {seconds * 1e3:11.3f} ms {items / seconds:12.3e} {unit}/s "
+              f"{results[name]['peak_bytes'] / 2**20:9.1f} MiB", flush=True)
+    return results
+
+
+def machine():
+    return {"platform": platform.platform(), "python": platform.python_version(),
+            "numpy": np.__version__, "cpus": os.cpu_count()}
+
+
+def compare(results, baseline, threshold, skipped=()):
+    """
+    Print speed ratios against the baseline; returns the failed case names
+    (regressed, without a baseline, or skipped although baselined).
+    """
+    base = baseline.get("results", {})
+    if baseline.get("machine") != machine():
+        print(f"\nNote: baseline recorded on {baseline.get('machine')}")
+    print(f"\n{'Case':<24} {'Baseline':>12} {'Now':>12} {'Ratio':>7}  Status")
+    print("-" * 66)
+    regressed = []
+    for name, res in results.items():
+        if name not in base:
+            regressed.append(name)
+            print(f"{name:<24} {'-':>12} {res['seconds'] * 1e3:9.3f} ms {'-':>7}  NO BASELINE")
+            continue
+        ratio = res["seconds"] / base[name]["seconds"]
+        status = "REGRESSED" if ratio > threshold else ("faster" if ratio < 1 / threshold else "ok")
+        if status == "REGRESSED":
+            regressed.append(name)
+        print(f"{name:<24} {base[name]['seconds'] * 1e3:9.3f} ms {res['seconds'] * 1e3:9.3f} ms "
+              f"{ratio:7.2f}  {status}")
+    for name in skipped:
+        if name in base:
+            regressed.append(name)
+            print(f"{name:<24} {base[name]['seconds'] * 1e3:9.3f} ms {'-':>12} {'-':>7}  SKIPPED")
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the SRHF hot paths.")
+    parser.add_argument("--quick", action="store_true",
+                        help=f"skip sweeps above {QUICK_MAX:.0e} points")
+    parser.add_argument("-k", dest="filter", default="", help="only cases containing FILTER")
+    parser.add_argument("--repeat", type=int, default=5, help="timing rounds per case")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store this run as the baseline (merged into existing cases)")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown factor counted as a regression")
+    parser.add_argument("--json", type=Path, default=None, help="also write results here")
+    args = parser.parse_args(argv)
+
+    cases, skipped = [], []
+    for case in CASES:
+        name, _, _, size, _, needs = case
+        if args.filter not in name:
+            continue
+        if args.quick and case[1] == "sweep" and size > QUICK_MAX:
+            continue
+        if needs and not _have(needs):
+            print(f"{name:<24} skipped ({needs} is not installed)")
+            skipped.append(name)
+            continue
+        cases.append(case)
+
+    print(f"{'Case':<24} {'Time/call':>14} {'Throughput':>18} {'Peak':>13}")
+    print("-" * 72)
+    results = run(cases, args.repeat)
+    report = {"machine": machine(), "seed": SEED, "results": results}
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2, sort_keys=True))
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    if args.save_baseline:
+        if baseline:
+            report["results"] = {**baseline["results"], **results}
+        args.baseline.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+    return 1 if compare(results, baseline, args.threshold, skipped) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Run plotting scripts in batch mode without editing them
+# Usage: python run_headless.py SCRIPT [SCRIPT ...]
+# =====================================================
+#
+# The v1.0–v2.0 scripts in scripts/ are GPG-signed and their SHA-256
+# hashes are pinned in proof/, so they cannot be changed to import
+# srhf.plotting. This runner gives them the same batch mode from the
+# outside: MPLBACKEND=Agg is set before matplotlib is first imported,
+# each script is executed as __main__ (outputs land in the current
+# directory, as when the script is run by hand), plt.show() returns
+# immediately and every figure is closed after the script ends.
+
+import os
+import runpy
+import sys
+import time
+import warnings
+
+os.environ["MPLBACKEND"] = "Agg"
+os.environ["SRHF_HEADLESS"] = "1"
+
+
+def run(path):
+    """Execute one script headless; returns the wall time in seconds."""
+    import matplotlib.pyplot as plt
+
+    start = time.perf_counter()
+    try:
+        with warnings.catch_warnings():
+            # Agg's show() only warns that it cannot open a window
+            warnings.filterwarnings("ignore", message=".*non-interactive.*")
+            runpy.run_path(path, run_name="__main__")
+    finally:
+        plt.close("all")
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    paths = sys.argv[1:] if argv is None else argv
+    if not paths:
+        sys.exit("Usage: python run_headless.py SCRIPT [SCRIPT ...]")
+    for path in paths:
+        seconds = run(path)
+        print(f"{os.path.basename(path):<60} {seconds:8.2f} s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
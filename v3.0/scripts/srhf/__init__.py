@@ -0,0 +1,84 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Shared model library for the v3.0 scripts
+# =====================================================
+#
+# The model and the closed-form optimisers are imported eagerly (numpy
+# only). Everything else is resolved on first access (PEP 562), so
+# `from srhf import rmse_optimum` does not pay for the process pools,
+# hashing or resampling machinery of the other submodules; see
+# check_import_budget.py for the measured startup budget. __all__ lists
+# both kinds, so `from srhf import *` also binds (and imports) the lazy
+# names.
+
+from importlib import import_module
+
+from .model import (
+    A, B, C, D,
+    OUTER_PLANETS, OUTER_OBSERVED, OUTER_RATIOS,
+    Ladder, OUTER_LADDER, FULL_LADDER,
+    A_H_SILVER, A_H_PI,
+    predict_outer, predict_ladder, residuals_pct, rmse, hsi, mape,
+)
+from .optimize import (
+    Optimum,
+    rmse_optimum, hsi_optimum, mape_optimum, residual_zero,
+)
+
+# public name -> (submodule, attribute)
+_LAZY = {
+    **{name: ("crossings", name) for name in
+       ("ladder_zeros", "tolerance_intervals", "grid_zeros")},
+    **{name: ("fit", name) for name in
+       ("FitResult", "ladder_residuals", "fit_ladder")},
+    **{name: ("search", name) for name in
+       ("Match", "small_rationals", "consecutive_ratios", "search_ratios", "format_table")},
+    **{name: ("montecarlo", name) for name in
+       ("MCEstimate", "outer_metrics", "reference_metrics", "run_monte_carlo",
+        "significance")},
+    **{name: ("resample", name) for name in
+       ("Interval", "resampled_statistics", "bootstrap", "jackknife")},
+    **{name: ("uncertainty", name) for name in
+       ("ROUNDING_SIGMA", "Propagated", "observation_covariance", "outer_quantities")},
+    "propagate_linearized": ("uncertainty", "linearized"),
+    "propagate_sampled": ("uncertainty", "sampled"),
+    "summarize_samples": ("uncertainty", "summarize"),
+    **{name: ("cache", name) for name in
+       ("ArrayCache", "model_hash", "sweep")},
+    **{name: ("adaptive", name) for name in
+       ("adaptive_sample", "plot_transform", "adaptive_sweep")},
+    **{name: ("export", name) for name in
+       ("parse_formats", "export_figure", "write_timing_report")},
+    **{name: ("data", name) for name in
+       ("SCHEMAS", "write_dataset", "read_dataset", "save_dataset")},
+    **{name: ("catalog", name) for name in
+       ("read_mpcorb", "load_catalog")},
+    **{name: ("belt", name) for name in
+       ("Profile", "Feature", "kirkwood_gaps", "ladder_nodes", "histogram_profile",
+        "kde_profile", "SortedAxes", "gap_statistics", "node_statistics")},
+}
+
+__all__ = [
+    "A", "B", "C", "D",
+    "OUTER_PLANETS", "OUTER_OBSERVED", "OUTER_RATIOS",
+    "Ladder", "OUTER_LADDER", "FULL_LADDER",
+    "A_H_SILVER", "A_H_PI",
+    "predict_outer", "predict_ladder", "residuals_pct", "rmse", "hsi", "mape",
+    "Optimum",
+    "rmse_optimum", "hsi_optimum", "mape_optimum", "residual_zero",
+    *_LAZY,
+]
+
+
+def __getattr__(name):
+    try:
+        module, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,128 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Adaptive-resolution a_H sweeps
+# =====================================================
+#
+# The figure curves are smooth almost everywhere; the structure sits in
+# narrow regions (the RMSE minimum, residual sign changes, and the kinks
+# of |residual| on log axes). Instead of a dense uniform linspace, the
+# sampler starts from a coarse grid and bisects only the intervals that
+# need it:
+#
+#   - the midpoint deviates from the straight line between the interval
+#     ends by more than `tol` (relative to each curve's span), measured
+#     in plot coordinates (after `transform`, e.g. log10|y|), or
+#   - any curve changes sign across the interval (refined down to
+#     adjacent grid points)
+#
+# Samples are taken from the uniform linspace the sweep replaces, so the
+# extremes of every curve (the depth of the |residual| dips on log axes,
+# and with it the automatic y-limits) are exactly those of the dense
+# grid; only the points along smooth stretches are skipped. Every
+# evaluated point is kept, so the result is a non-uniform subset of that
+# grid and its curve values, ready to be passed to plot().
+
+import numpy as np
+
+from .cache import ArrayCache
+from .model import OUTER_OBSERVED, OUTER_RATIOS, residuals_pct, rmse, hsi
+from .profiling import profiled
+
+
+def adaptive_sample(func, start, stop, tol=1e-3, transform=None, initial=17,
+                    grid=2000, max_points=20_000):
+    """
+    Adaptively sample a batched curve function on [start, stop].
+
+    func       maps an (N,) array of x to (N,) or (N, k) curve values
+    transform  maps values to plot coordinates before the error test
+    grid       size of the uniform linspace the samples are drawn from;
+               sign changes are refined down to adjacent grid points, so
+               zero dips on log axes reach exactly the depth of the dense
+               linspace(start, stop, grid) they replace
+
+    Returns (x, y) with x sorted and y of shape (len(x), k).
+    """
+    def evaluate(i):
+        return np.asarray(func(xs[i]), dtype=float).reshape(len(i), -1)
+
+    if transform is None:
+        transform = lambda y: y
+
+    xs = np.linspace(start, stop, grid)
+    i = np.unique(np.linspace(0, grid - 1, initial).round().astype(np.int64))
+    y = evaluate(i)
+    active = np.diff(i) > 1
+
+    while active.any() and i.size < max_points:
+        idx = np.flatnonzero(active)
+        im = (i[idx] + i[idx + 1]) // 2
+        ym = evaluate(im)
+
+        with np.errstate(all="ignore"):
+            t_all = transform(np.concatenate([y, ym]))
+            finite = np.where(np.isfinite(t_all), t_all, np.nan)
+            scale = np.nanmax(finite, axis=0) - np.nanmin(finite, axis=0)
+            scale = np.where(scale > 0, scale, 1.0)
+            # Chord value at the grid midpoint (not always the exact centre)
+            w = ((im - i[idx]) / (i[idx + 1] - i[idx]))[:, None]
+            t_l, t_r, t_m = transform(y[idx]), transform(y[idx + 1]), transform(ym)
+            err = np.abs(t_m - ((1 - w) * t_l + w * t_r)) / scale
+        err = np.where(np.isnan(err), np.inf, err).max(axis=1)
+        sign_change = np.any(np.sign(y[idx]) * np.sign(y[idx + 1]) < 0, axis=1)
+
+        refine = (err > tol) | sign_change
+        flags = np.zeros(active.size, dtype=bool)
+        flags[idx] = refine
+        active = np.insert(flags, idx + 1, refine)
+        i = np.insert(i, idx + 1, im)
+        y = np.insert(y, idx + 1, ym, axis=0)
+        active &= np.diff(i) > 1
+
+    return xs[i], y
+
+
+def plot_transform(yscale="linear", linthresh=0.05):
+    """Map values to the coordinates of a matplotlib y-scale."""
+    if yscale == "log":
+        return lambda y: np.log10(np.abs(y))
+    if yscale == "symlog":
+        return lambda y: np.where(np.abs(y) <= linthresh, y / linthresh,
+                                  np.sign(y) * (1 + np.log10(np.abs(y) / linthresh)))
+    return lambda y: y
+
+
+@profiled("adaptive_sweep.compute")
+def _compute_adaptive_sweep(start, stop, tol, yscale, linthresh, grid, observeds, ratios):
+    n = len(observeds)
+    to_plot = plot_transform(yscale, linthresh)
+
+    def curves(a):
+        return np.column_stack([rmse(a, observeds, ratios), hsi(a, observeds, ratios),
+                                residuals_pct(a, observeds, ratios)])
+
+    def transform(y):
+        return np.concatenate([y[:, :2], to_plot(y[:, 2:])], axis=1)
+
+    a, y = adaptive_sample(curves, start, stop, tol, transform, grid=grid)
+    return {"a_H": a, "rmse": y[:, 0], "hsi": y[:, 1], "residuals_pct": y[:, 2:2 + n]}
+
+
+@profiled("adaptive_sweep")
+def adaptive_sweep(start=2.12, stop=2.18, tol=1e-3, yscale="linear", linthresh=0.05,
+                   grid=2000, observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS, cache=None):
+    """
+    Adaptive a_H sweep of RMSE, HSI and percent residuals.
+
+    Same keys as sweep(), on a non-uniform subset of sweep(start, stop,
+    grid). RMSE and HSI are resolved on linear axes; the residuals on
+    `yscale` ("linear", "log" for |residual|, or "symlog" with
+    `linthresh`), as in the figures. Results go through the on-disk
+    cache.
+    """
+    cache = cache or ArrayCache()
+    return cache.memoize("adaptive_sweep", _compute_adaptive_sweep,
+                         start=float(start), stop=float(stop), tol=float(tol),
+                         yscale=yscale, linthresh=float(linthresh), grid=int(grid),
+                         observeds=np.asarray(observeds, dtype=float),
+                         ratios=np.asarray(ratios, dtype=float))
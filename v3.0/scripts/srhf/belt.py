@@ -0,0 +1,170 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Semi-major-axis density of the asteroid belt around SRHF nodes
+# =====================================================
+#
+# Works on the catalog semi-major axes from catalog.load_catalog() (or
+# any array of a values, AU):
+#
+#   histogram_profile()   counts per bin, as objects per AU
+#   kde_profile()         Gaussian KDE on a uniform grid: the objects are
+#                         linearly binned onto the grid and convolved
+#                         with the kernel by FFT, so the cost is
+#                         O(N + G log G) for N objects and G grid points
+#                         (sub-milli-AU grids over the whole belt take
+#                         tens of milliseconds for millions of objects)
+#   SortedAxes            sorted copy of a; counts in [lo, hi) and
+#                         "within ±delta of each node" by binary search,
+#                         O(log N) per query
+#   gap_statistics()      depth, contrast and width of the Kirkwood gaps
+#   node_statistics()     the same around the SRHF ladder nodes (peaks)
+#
+# Profiles are in objects per AU (dN/da), so histogram and KDE profiles
+# of the same catalog are directly comparable.
+
+from collections import namedtuple
+
+import numpy as np
+
+from .model import A_H_SILVER, FULL_LADDER, OUTER_OBSERVED
+from .profiling import profiled
+
+# Jupiter mean-motion resonances (asteroid : Jupiter orbits) of the main
+# Kirkwood gaps
+KIRKWOOD = {"4:1": (4, 1), "3:1": (3, 1), "5:2": (5, 2), "7:3": (7, 3), "2:1": (2, 1)}
+
+DEFAULT_BANDWIDTH = 2e-3     # AU
+DEFAULT_STEP = 2e-4          # AU (KDE grid)
+DEFAULT_WINDOW = 0.03        # AU, half-width searched for a gap or peak
+
+Profile = namedtuple("Profile", ["a", "density", "step", "bandwidth", "count"])
+Profile.__doc__ = """
+Density profile on a uniform grid: grid points a (AU), density in
+objects per AU, grid step, KDE bandwidth (None for a histogram) and the
+number of objects inside the grid range.
+"""
+
+Feature = namedtuple("Feature", ["nominal", "a", "density", "at_nominal", "background",
+                                 "contrast", "width"])
+Feature.__doc__ = """
+Gap or peak near a nominal position: location and density of the
+extremum, density at the nominal position, local background (median of
+the flanks), contrast = density / background, and the full width (AU)
+of the region beyond half-way between extremum and background.
+"""
+
+
+def kirkwood_gaps(a_jupiter=OUTER_OBSERVED[0]):
+    """{resonance: a (AU)} of the Kirkwood gaps from Kepler's third law."""
+    return {label: float(a_jupiter * (q / p) ** (2 / 3)) for label, (p, q) in KIRKWOOD.items()}
+
+
+def ladder_nodes(a_H=A_H_SILVER):
+    """{body: predicted a (AU)} of the full SRHF ladder at a_H."""
+    return dict(zip(FULL_LADDER.names, (FULL_LADDER.slopes * a_H + FULL_LADDER.intercepts).tolist()))
+
+
+def _grid(start, stop, step):
+    n = int(round((stop - start) / step)) + 1
+    return start + step * np.arange(n)
+
+
+@profiled("belt.histogram")
+def histogram_profile(a, start, stop, step=1e-3):
+    """Histogram of a over [start, stop) in bins of `step`, at the bin centres."""
+    from .catalog import density
+
+    edges, counts = density(a, start, stop, step)
+    return Profile(edges[:-1] + step / 2, counts / step, step, None, int(counts.sum()))
+
+
+@profiled("belt.kde")
+def kde_profile(a, start, stop, step=DEFAULT_STEP, bandwidth=DEFAULT_BANDWIDTH):
+    """Gaussian KDE of a on the grid start, start + step, ..., stop."""
+    grid = _grid(start, stop, step)
+    # Objects within 6 bandwidths of the range still contribute to it
+    pad = int(np.ceil(6 * bandwidth / step))
+    n = grid.size + 2 * pad
+    a = np.asarray(a)
+    pos = (a.astype(np.float64) - (start - pad * step)) / step
+    pos = pos[(pos >= 0) & (pos < n - 1)]
+
+    # Linear binning: each object is split between its two grid points
+    left = pos.astype(np.int64)
+    frac = pos - left
+    counts = np.bincount(left, 1 - frac, minlength=n) + np.bincount(left + 1, frac, minlength=n)
+
+    # Convolution with the Gaussian (exact transform), zero-padded so the
+    # circular convolution does not wrap around
+    nfft = 1 << int(np.ceil(np.log2(n + 2 * pad)))
+    freq = np.fft.rfftfreq(nfft, step)
+    kernel = np.exp(-2 * (np.pi * bandwidth * freq) ** 2)
+    smooth = np.fft.irfft(np.fft.rfft(counts, nfft) * kernel, nfft)[:n]
+    density = np.maximum(smooth[pad:pad + grid.size], 0) / step
+    inside = int(np.count_nonzero((a >= start) & (a <= stop)))
+    return Profile(grid, density, step, bandwidth, inside)
+
+
+class SortedAxes:
+    """Sorted semi-major axes for fast range counts."""
+
+    def __init__(self, a):
+        self.a = np.sort(np.asarray(a).ravel())
+
+    def __len__(self):
+        return self.a.size
+
+    def _position(self, values):
+        # Compare in the array's own dtype; mixing float64 queries with a
+        # float32 catalog would copy the whole array on every call
+        return np.searchsorted(self.a, np.asarray(values, dtype=self.a.dtype), side="left")
+
+    def count(self, lo, hi):
+        """Objects with lo <= a < hi (lo, hi scalars or arrays)."""
+        return self._position(hi) - self._position(lo)
+
+    def within(self, centers, delta):
+        """Objects with |a - center| < delta for each center."""
+        centers = np.asarray(centers, dtype=float)
+        return self.count(centers - delta, centers + delta)
+
+    def select(self, lo, hi):
+        """Sorted view of the a values in [lo, hi)."""
+        return self.a[self._position(lo):self._position(hi)]
+
+
+def feature(profile, nominal, kind="gap", window=DEFAULT_WINDOW):
+    """Feature (gap = minimum, peak = maximum) within ±window of nominal."""
+    a, dens = profile.a, profile.density
+    near = np.flatnonzero(np.abs(a - nominal) <= window)
+    flanks = (np.abs(a - nominal) > window) & (np.abs(a - nominal) <= 3 * window)
+    if near.size == 0:
+        raise ValueError(f"{nominal} AU is outside the profile range")
+    i = near[np.argmin(dens[near])] if kind == "gap" else near[np.argmax(dens[near])]
+    background = float(np.median(dens[flanks])) if flanks.any() else float("nan")
+
+    # Contiguous run around the extremum beyond half-way to the background
+    half = (dens[i] + background) / 2
+    beyond = dens < half if kind == "gap" else dens > half
+    lo = i - np.argmin(beyond[i::-1]) + 1 if not beyond[:i + 1].all() else 0
+    hi = i + np.argmin(beyond[i:]) if not beyond[i:].all() else a.size
+    width = (hi - lo) * profile.step if beyond[i] else 0.0
+
+    at_nominal = float(np.interp(nominal, a, dens))
+    contrast = dens[i] / background if background > 0 else float("nan")
+    return Feature(float(nominal), float(a[i]), float(dens[i]), at_nominal, background,
+                   float(contrast), float(width))
+
+
+def gap_statistics(profile, gaps=None, window=DEFAULT_WINDOW):
+    """{label: Feature} of the Kirkwood gaps (or `gaps`, {label: a}) in range."""
+    gaps = kirkwood_gaps() if gaps is None else gaps
+    return {label: feature(profile, a, "gap", window) for label, a in gaps.items()
+            if profile.a[0] <= a <= profile.a[-1]}
+
+
+def node_statistics(profile, nodes=None, window=DEFAULT_WINDOW):
+    """{label: Feature} of the density peaks near the SRHF nodes in range."""
+    nodes = ladder_nodes() if nodes is None else nodes
+    return {label: feature(profile, a, "peak", window) for label, a in nodes.items()
+            if profile.a[0] <= a <= profile.a[-1]}
@@ -0,0 +1,157 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Persistent on-disk cache for sweep and residual arrays
+# =====================================================
+#
+# Content-addressed: an entry's key is the SHA-256 of
+#
+#   model hash   model.py source + the ratio/ladder arrays, so any edit
+#                to the ladder formulas invalidates every entry
+#   name         what was computed ("sweep", ...)
+#   parameters   range, resolution, observed dataset (arrays by bytes)
+#
+# Each entry is a directory <key>/ holding one .npy file per array,
+# written to a temporary directory and renamed into place. Reads return
+# read-only memory maps. Entry directories are touched on every hit and
+# the least recently used ones are evicted once the cache exceeds
+# `max_bytes`.
+#
+# Location: $SRHF_CACHE_DIR, else v3.0/scripts/.srhf_cache.
+# SRHF_CACHE=0 disables the cache (everything is recomputed).
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from . import model
+from .model import OUTER_OBSERVED, OUTER_RATIOS, residuals_pct, rmse, hsi
+from .profiling import profiled
+
+DEFAULT_DIR = Path(__file__).resolve().parent.parent / ".srhf_cache"
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+
+@lru_cache(maxsize=None)
+def model_hash():
+    """SHA-256 of the model definition (source and ladder arrays)."""
+    h = hashlib.sha256(inspect.getsource(model).encode())
+    for arr in (model.OUTER_OBSERVED, model.OUTER_RATIOS,
+                model.FULL_LADDER.observed, model.FULL_LADDER.slopes,
+                model.FULL_LADDER.intercepts):
+        h.update(np.ascontiguousarray(arr, dtype=float).tobytes())
+    return h.hexdigest()
+
+
+def _canonical(value):
+    if isinstance(value, np.ndarray):
+        arr = np.ascontiguousarray(value, dtype=float)
+        return {"shape": arr.shape, "sha256": hashlib.sha256(arr.tobytes()).hexdigest()}
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class ArrayCache:
+    """Content-addressed store of named array bundles with LRU eviction."""
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory or os.environ.get("SRHF_CACHE_DIR", DEFAULT_DIR))
+        self.max_bytes = max_bytes
+
+    def key(self, name, **params):
+        payload = {"model": model_hash(), "name": name,
+                   "params": {k: _canonical(v) for k, v in sorted(params.items())}}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key):
+        """{name: read-only memmap} for a stored entry, or None."""
+        entry = self.directory / key
+        if not entry.is_dir():
+            return None
+        try:
+            arrays = {f.stem: np.load(f, mmap_mode="r") for f in entry.glob("*.npy")}
+            os.utime(entry)
+        except (OSError, ValueError):
+            return None
+        return arrays
+
+    def put(self, key, arrays):
+        """Store {name: array} atomically under key, then evict."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(dir=self.directory, prefix=".tmp-"))
+        for name, arr in arrays.items():
+            np.save(tmp / f"{name}.npy", np.asarray(arr))
+        try:
+            os.replace(tmp, self.directory / key)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)   # written concurrently
+        self.evict()
+
+    def memoize(self, name, compute, **params):
+        """Cached compute(**params) -> {name: array}."""
+        if os.environ.get("SRHF_CACHE", "1") == "0":
+            return compute(**params)
+        key = self.key(name, **params)
+        arrays = self.get(key)
+        if arrays is None:
+            arrays = compute(**params)
+            self.put(key, arrays)
+            arrays = self.get(key) or arrays   # None if evicted at once
+        return arrays
+
+    def entries(self):
+        """[(mtime, bytes, path)] of stored entries, oldest first."""
+        if not self.directory.is_dir():
+            return []
+        out = []
+        for entry in self.directory.iterdir():
+            if entry.is_dir() and not entry.name.startswith(".tmp-"):
+                size = sum(f.stat().st_size for f in entry.iterdir())
+                out.append((entry.stat().st_mtime, size, entry))
+        return sorted(out)
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+@profiled("sweep.compute")
+def _compute_sweep(start, stop, num, observeds, ratios):
+    a_range = np.linspace(start, stop, num)
+    return {
+        "a_H": a_range,
+        "rmse": rmse(a_range, observeds, ratios),
+        "hsi": hsi(a_range, observeds, ratios),
+        "residuals_pct": residuals_pct(a_range, observeds, ratios),
+    }
+
+
+@profiled("sweep")
+def sweep(start=2.12, stop=2.18, num=2000, observeds=OUTER_OBSERVED,
+          ratios=OUTER_RATIOS, cache=None):
+    """
+    Uniform a_H sweep of RMSE, HSI and percent residuals, read from the
+    on-disk cache when available.
+
+    Returns {"a_H": (num,), "rmse": (num,), "hsi": (num,),
+             "residuals_pct": (num, 5)}.
+    """
+    cache = cache or ArrayCache()
+    return cache.memoize("sweep", _compute_sweep, start=float(start), stop=float(stop),
+                         num=int(num), observeds=np.asarray(observeds, dtype=float),
+                         ratios=np.asarray(ratios, dtype=float))
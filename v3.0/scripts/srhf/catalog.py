@@ -0,0 +1,142 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Asteroid orbital-element catalog (MPCORB format)
+# =====================================================
+#
+# The Minor Planet Center's MPCORB.DAT lists about 1.3 million orbits,
+# one fixed-width record per line. Only three of its columns matter for
+# the Harmonia figures (1-based, as in the MPC format description):
+#
+#   60-68    i   inclination to the ecliptic (deg)
+#   71-79    e   eccentricity
+#   93-103   a   semi-major axis (AU)
+#
+# read_mpcorb() streams the file (plain or .gz) in blocks of lines and
+# converts each block's fields with numpy, so memory stays bounded by
+# the block size plus the output arrays. Everything up to the dashed
+# line that ends the MPCORB header, blank section separators and lines
+# too short to hold an orbit are skipped.
+#
+# load_catalog() keeps a, e and i as float32 arrays (12 bytes per
+# object, ~16 MB for the full catalog) in the srhf array cache (see
+# cache.py), keyed by the catalog's path, size and mtime. The first
+# call parses the file; later calls return memory maps in milliseconds.
+#
+# Location: the `path` argument, else $SRHF_MPCORB, else
+# v3.0/data/MPCORB.DAT(.gz). Without a catalog load_catalog() returns
+# None and the figures fall back to their schematic belt.
+
+import gzip
+import itertools
+import os
+from pathlib import Path
+
+import numpy as np
+
+from .profiling import profiled
+
+DEFAULT_PATHS = tuple(Path(__file__).resolve().parent.parent.parent / "data" / name
+                      for name in ("MPCORB.DAT", "MPCORB.DAT.gz"))
+
+# element -> 0-based [start, stop) byte columns
+FIELDS = {"a": (92, 103), "e": (70, 79), "i": (59, 68)}
+RECORD_LENGTH = max(stop for _, stop in FIELDS.values())
+BLOCK_LINES = 65536
+PARSER_VERSION = 1
+
+
+def catalog_path(path=None):
+    """The catalog to read (see above), or None when there is none."""
+    if path is None:
+        path = os.environ.get("SRHF_MPCORB")
+    if path:
+        return Path(path)
+    return next((p for p in DEFAULT_PATHS if p.exists()), None)
+
+
+def _open(path):
+    path = Path(path)
+    return gzip.open(path, "rb") if path.suffix == ".gz" else open(path, "rb")
+
+
+def _parse_block(lines):
+    """(3, n) float64 a, e, i of the orbit records in a block of lines."""
+    records = [line for line in lines if len(line.rstrip()) >= RECORD_LENGTH]
+    try:
+        return np.array([np.array([line[start:stop] for line in records],
+                                  dtype=f"S{stop - start}").astype(np.float64)
+                         for start, stop in FIELDS.values()]).reshape(len(FIELDS), -1)
+    except ValueError:
+        pass
+    # Rare: a malformed or non-orbit line in the block; parse line by line
+    rows = []
+    for line in records:
+        try:
+            rows.append([float(line[start:stop]) for start, stop in FIELDS.values()])
+        except ValueError:
+            continue
+    return np.array(rows, dtype=np.float64).reshape(-1, len(FIELDS)).T
+
+
+@profiled("catalog.parse")
+def read_mpcorb(path):
+    """{"a", "e", "i": float32 arrays} of every orbit in an MPCORB-format file."""
+    blocks = []
+    with _open(path) as fh:
+        while True:
+            lines = list(itertools.islice(fh, BLOCK_LINES))
+            if not lines:
+                break
+            header_end = [n for n, line in enumerate(lines) if line.startswith(b"-----")]
+            if header_end:                        # drop the MPCORB header
+                blocks.clear()
+                lines = lines[header_end[-1] + 1:]
+            blocks.append(_parse_block(lines).astype(np.float32))
+    elements = np.concatenate(blocks, axis=1) if blocks else \
+        np.empty((len(FIELDS), 0), dtype=np.float32)
+    return dict(zip(FIELDS, elements))
+
+
+@profiled("catalog.load")
+def load_catalog(path=None, cache=None):
+    """
+    Cached a, e, i arrays of the catalog (read-only memory maps), or
+    None when no catalog file is configured.
+    """
+    from .cache import ArrayCache
+
+    path = catalog_path(path)
+    if path is None:
+        return None
+    stat = path.stat()
+    cache = cache or ArrayCache()
+    return cache.memoize("mpcorb", lambda **_: read_mpcorb(path),
+                         path=str(path.resolve()), size=stat.st_size,
+                         mtime_ns=stat.st_mtime_ns, version=PARSER_VERSION)
+
+
+def density(a, start, stop, width=0.01):
+    """(bin edges, counts) of semi-major axes in uniform bins of `width` AU."""
+    nbins = int(round((stop - start) / width))
+    edges = start + width * np.arange(nbins + 1)
+    a = np.asarray(a)
+    index = np.floor((a - start) / width).astype(np.int64)
+    index = index[(index >= 0) & (index < nbins)]
+    return edges, np.bincount(index, minlength=nbins)
+
+
+def radial_image(edges, counts, extent, pixels=800):
+    """
+    Face-on image of a radial density: each pixel at heliocentric
+    distance r takes the count of the bin containing r (NaN outside
+    the bins or where the count is zero), for imshow over `extent`.
+    """
+    x = np.linspace(extent[0], extent[1], pixels)
+    y = np.linspace(extent[2], extent[3], pixels)
+    r = np.hypot(x[None, :], y[:, None])
+    index = np.searchsorted(edges, r, side="right") - 1
+    inside = (index >= 0) & (index < counts.size)
+    image = np.full(r.shape, np.nan)
+    image[inside] = counts[index[inside]]
+    image[image == 0] = np.nan
+    return image
@@ -0,0 +1,105 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Residual zero crossings and tolerance intervals
+# =====================================================
+#
+# For a linear ladder, pred_i = slope_i * a_H + intercept_i, every
+# residual changes sign exactly once, at a_H = (obs_i - intercept_i) / slope_i,
+# and stays within ±x% on a single closed interval. Both follow in
+# closed form for all bodies at once. Ladder fields may carry leading
+# batch axes, e.g. (N, n_bodies) arrays for N candidate ladders, and
+# are solved together in one broadcast pass.
+#
+# Bodies whose prediction does not depend on a_H (slope 0, e.g. the
+# inner planets of the full ladder) have no crossing (NaN); their
+# tolerance interval is the whole axis or empty. Bodies without an
+# observed value (NaN, e.g. Harmonia) give NaN throughout.
+#
+# grid_zeros() covers residual curves that are only available as
+# samples, for any ladder definition, by linear interpolation between
+# the first pair of samples that changes sign.
+
+import numpy as np
+
+from .model import OUTER_LADDER
+
+
+def _restrict(lo, hi, bounds):
+    """Intersect [lo, hi] with bounds; empty intersections become NaN."""
+    if bounds is not None:
+        lo = np.maximum(lo, bounds[0])
+        hi = np.minimum(hi, bounds[1])
+    empty = ~(lo <= hi)
+    return np.where(empty, np.nan, lo), np.where(empty, np.nan, hi)
+
+
+def ladder_zeros(ladder=OUTER_LADDER, bounds=None):
+    """
+    a_H at which each body's residual is zero, shape (..., n_bodies).
+
+    Crossings outside `bounds` (if given) are reported as NaN.
+    """
+    observed = np.asarray(ladder.observed, dtype=float)
+    slopes = np.asarray(ladder.slopes, dtype=float)
+    intercepts = np.asarray(ladder.intercepts, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zeros = (observed - intercepts) / slopes
+    zeros = np.where(slopes == 0, np.nan, zeros)
+    return _restrict(zeros, zeros, bounds)[0]
+
+
+def tolerance_intervals(pct, ladder=OUTER_LADDER, bounds=None):
+    """
+    Closed a_H intervals on which each |residual| ≤ pct percent.
+
+    Returns (lo, hi), each of shape (..., n_bodies); empty intervals
+    are (NaN, NaN). `pct` may itself be an array broadcasting against
+    the body axis, e.g. np.array([[0.1], [1.0]]) for two bands at once.
+    """
+    observed = np.asarray(ladder.observed, dtype=float)
+    slopes = np.asarray(ladder.slopes, dtype=float)
+    intercepts = np.asarray(ladder.intercepts, dtype=float)
+    tol = np.asarray(pct, dtype=float) / 100 * np.abs(observed)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        end_1 = (observed - tol - intercepts) / slopes
+        end_2 = (observed + tol - intercepts) / slopes
+    lo = np.minimum(end_1, end_2)
+    hi = np.maximum(end_1, end_2)
+
+    # Constant predictions: the whole axis if already within tolerance
+    flat = slopes == 0
+    inside = np.abs(intercepts - observed) <= tol
+    lo = np.where(flat, np.where(inside, -np.inf, np.nan), lo)
+    hi = np.where(flat, np.where(inside, np.inf, np.nan), hi)
+    return _restrict(lo, hi, bounds)
+
+
+def grid_zeros(a_range, residuals):
+    """
+    First sign change of sampled residual curves.
+
+    a_range    (N,) increasing sample points
+    residuals  (..., N, n_bodies) residuals at those points
+
+    Returns (..., n_bodies) interpolated crossings, NaN where a body's
+    residual never changes sign on the grid (including residuals that
+    are identically zero).
+    """
+    a_range = np.asarray(a_range, dtype=float)
+    residuals = np.asarray(residuals, dtype=float)
+    r0 = residuals[..., :-1, :]
+    r1 = residuals[..., 1:, :]
+    nonzero = (r0 != 0) & (r1 != 0)
+    change = (r0 == 0) & (r1 != 0) | nonzero & (np.signbit(r0) != np.signbit(r1))
+
+    found = change.any(axis=-2)
+    i = np.argmax(change, axis=-2)[..., np.newaxis, :]
+    y0 = np.take_along_axis(r0, i, axis=-2)[..., 0, :]
+    y1 = np.take_along_axis(r1, i, axis=-2)[..., 0, :]
+    x0 = a_range[:-1][i[..., 0, :]]
+    x1 = a_range[1:][i[..., 0, :]]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zeros = np.where(y0 == 0, x0, x0 - y0 * (x1 - x0) / (y1 - y0))
+    return np.where(found, zeros, np.nan)
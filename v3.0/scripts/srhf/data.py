@@ -0,0 +1,181 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Columnar export of the figure datasets
+# =====================================================
+#
+# Every dataset behind a figure is one of three fixed table layouts
+# (SCHEMAS):
+#
+#   sweep        a_H grid with RMSE, HSI and the outer-planet residuals
+#   candidates   the same metrics at named a_H values (opt, Silver, pi)
+#   ladder       per-body observed vs predicted distances, one row per
+#                (body, model)
+#
+# Column names, order and dtypes never depend on the figure, so the
+# tables can be concatenated, diffed between runs and loaded without
+# knowing which script wrote them.
+#
+# Tables are written as Parquet (zstd) when pyarrow is installed and as
+# CSV otherwise; $SRHF_DATA_FORMAT=parquet|csv overrides the choice.
+# Export is opt-in: save_dataset() writes to $SRHF_DATA_DIR (or the
+# builder's --data directory) and does nothing when it is unset, so the
+# figure scripts behave exactly as before. read_dataset() returns the
+# columns as numpy arrays (memory-mapped for Parquet) with the schema's
+# dtypes, whichever format was written.
+
+import csv
+import os
+
+import numpy as np
+
+from .model import OUTER_PLANETS, hsi, residuals_pct, rmse
+
+SCHEMA_VERSION = "1"
+
+_RESIDUALS = tuple((f"residual_pct_{name}", "float64") for name in OUTER_PLANETS)
+
+# kind -> ((column, dtype), ...)
+SCHEMAS = {
+    "sweep": (("a_H", "float64"), ("rmse", "float64"), ("hsi", "float64"), *_RESIDUALS),
+    "candidates": (("candidate", "str"), ("a_H", "float64"), ("rmse", "float64"),
+                   ("hsi", "float64"), *_RESIDUALS),
+    "ladder": (("body", "str"), ("model", "str"), ("observed", "float64"),
+               ("predicted", "float64"), ("deviation_pct", "float64")),
+}
+
+FORMATS = ("parquet", "csv")
+
+
+def _have_pyarrow():
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def default_format():
+    """$SRHF_DATA_FORMAT, else "parquet" if pyarrow is installed, else "csv"."""
+    fmt = os.environ.get("SRHF_DATA_FORMAT") or ("parquet" if _have_pyarrow() else "csv")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown data format: {fmt!r}")
+    return fmt
+
+
+def _columns(kind, columns):
+    """Validate `columns` against SCHEMAS[kind]; ordered {name: 1-D array}."""
+    try:
+        schema = SCHEMAS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown dataset kind: {kind!r}") from None
+    names = [name for name, _ in schema]
+    if set(columns) != set(names):
+        raise ValueError(f"{kind} columns must be {names}, got {sorted(columns)}")
+    out = {}
+    for name, dtype in schema:
+        values = np.asarray(columns[name])
+        out[name] = values.astype(str if dtype == "str" else dtype).reshape(-1)
+    lengths = {len(v) for v in out.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"{kind} columns have different lengths: {sorted(lengths)}")
+    return out
+
+
+def sweep_columns(curves):
+    """Sweep-table columns from a cache.sweep()/adaptive_sweep() result."""
+    resid = np.asarray(curves["residuals_pct"])
+    return {"a_H": curves["a_H"], "rmse": curves["rmse"], "hsi": curves["hsi"],
+            **{name: resid[:, i] for i, (name, _) in enumerate(_RESIDUALS)}}
+
+
+def candidate_columns(candidates):
+    """Candidates-table columns from {label: a_H}, evaluated on the outer model."""
+    labels = list(candidates)
+    a_H = np.array([candidates[label] for label in labels], dtype=float)
+    resid = residuals_pct(a_H)
+    return {"candidate": labels, "a_H": a_H, "rmse": rmse(a_H), "hsi": hsi(a_H),
+            **{name: resid[:, i] for i, (name, _) in enumerate(_RESIDUALS)}}
+
+
+def ladder_columns(bodies, observed, predicted, model):
+    """Ladder-table columns for one model's predictions."""
+    observed = np.asarray(observed, dtype=float)
+    predicted = np.asarray(predicted, dtype=float)
+    return {"body": list(bodies), "model": [model] * len(bodies),
+            "observed": observed, "predicted": predicted,
+            "deviation_pct": (predicted / observed - 1) * 100}
+
+
+def concat_columns(*tables):
+    """Row-wise concatenation of column dicts with the same keys."""
+    return {name: np.concatenate([np.asarray(t[name]) for t in tables]) for name in tables[0]}
+
+
+def write_dataset(path, kind, columns, fmt=None):
+    """Write one table of the given kind to `path` (extension added); returns the path."""
+    from .cache import model_hash
+
+    fmt = fmt or default_format()
+    cols = _columns(kind, columns)
+    path = f"{os.path.splitext(os.fspath(path))[0]}.{fmt}"
+    tmp = f"{path}.tmp{os.getpid()}"
+
+    if fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types = {"float64": pa.float64(), "str": pa.string()}
+        schema = pa.schema([(name, types[dtype]) for name, dtype in SCHEMAS[kind]],
+                           metadata={"srhf.kind": kind, "srhf.schema": SCHEMA_VERSION,
+                                     "srhf.model": model_hash()})
+        table = pa.table({name: pa.array(values.tolist() if values.dtype.kind == "U" else values)
+                          for name, values in cols.items()}, schema=schema)
+        pq.write_table(table, tmp, compression="zstd")
+    else:
+        with open(tmp, "w", newline="") as fh:
+            fh.write(f"# srhf.kind={kind} srhf.schema={SCHEMA_VERSION} "
+                     f"srhf.model={model_hash()}\n")
+            writer = csv.writer(fh)
+            writer.writerow(cols)
+            # repr() round-trips every float64 exactly
+            rows = [[repr(float(v)) if values.dtype.kind == "f" else str(v) for v in values]
+                    for values in cols.values()]
+            writer.writerows(zip(*rows))
+    os.replace(tmp, path)
+    return path
+
+
+def read_dataset(path):
+    """(kind, {column: ndarray}) of a table written by write_dataset()."""
+    path = os.fspath(path)
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path, memory_map=True)
+        kind = table.schema.metadata[b"srhf.kind"].decode()
+        cols = {name: table.column(name).to_numpy() for name in table.column_names}
+    else:
+        with open(path, newline="") as fh:
+            header = dict(item.split("=", 1) for item in fh.readline()[1:].split())
+            kind = header["srhf.kind"]
+            rows = list(csv.reader(fh))
+        names, rows = rows[0], rows[1:]
+        cols = dict(zip(names, (list(col) for col in zip(*rows)))) if rows else \
+            {name: [] for name in names}
+    types = dict(SCHEMAS[kind])
+    return kind, {name: np.asarray(values, dtype=str if types[name] == "str" else types[name])
+                  for name, values in cols.items()}
+
+
+def save_dataset(name, kind, columns, data_dir=None):
+    """
+    Write <data_dir>/<name>.<fmt> if a data directory is configured.
+
+    data_dir defaults to $SRHF_DATA_DIR; returns the path, or None when
+    data export is off.
+    """
+    data_dir = data_dir or os.environ.get("SRHF_DATA_DIR")
+    if not data_dir:
+        return None
+    os.makedirs(data_dir, exist_ok=True)
+    return write_dataset(os.path.join(data_dir, name), kind, columns)
@@ -0,0 +1,153 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Render-once multi-format figure export
+# =====================================================
+#
+# Format specs:
+#
+#   "png@300"      PNG at 300 dpi (any dpi)
+#   "webp@thumb"   WebP thumbnail, THUMB_WIDTH pixels wide
+#   "webp@150"     WebP at 150 dpi
+#   "pdf", "svg"   vector output
+#
+# All raster outputs come from a single Agg draw at the highest
+# requested dpi. That draw is captured as a raw RGBA buffer (with the
+# usual bbox_inches="tight" cropping); lower resolutions and
+# thumbnails are resampled from it, and all PNG/WebP encodings then run
+# in parallel threads (Pillow releases the GIL while encoding). Vector
+# formats need their own backend pass each, but reuse matplotlib's
+# cached text and mathtext layout from the raster draw.
+#
+# The default set is $SRHF_FORMATS (comma-separated) or "png@300", which
+# reproduces the published figures. Every stage is timed and recorded
+# in TIMINGS; write_timing_report() saves them as CSV.
+
+import io
+import os
+import time
+import warnings
+
+from .profiling import profiled, stage
+
+DEFAULT_FORMATS = ("png@300",)
+THUMB_WIDTH = 480
+VECTOR = ("pdf", "svg")
+RASTER = ("png", "webp")
+
+# (figure, output, stage, seconds) rows of every export in this process
+TIMINGS = []
+
+
+def parse_formats(formats=None):
+    """[(ext, dpi or "thumb" or None)] from specs; defaults to $SRHF_FORMATS."""
+    if formats is None:
+        formats = os.environ.get("SRHF_FORMATS") or DEFAULT_FORMATS
+    if isinstance(formats, str):
+        formats = [f for f in formats.split(",") if f.strip()]
+    out = []
+    for spec in formats:
+        ext, _, res = spec.strip().lower().partition("@")
+        if ext in VECTOR and not res:
+            out.append((ext, None))
+        elif ext in RASTER and (res == "thumb" or res.isdigit()):
+            out.append((ext, res if res == "thumb" else int(res)))
+        else:
+            raise ValueError(f"Unknown figure format: {spec!r}")
+    return out
+
+
+def _output_name(stem, ext, res, rasters):
+    # The highest-dpi PNG keeps the plain name (stem.png), as before
+    same_ext = [r for e, r in rasters if e == ext and r != "thumb"]
+    if res is None or res == max(same_ext, default=None):
+        return f"{stem}.{ext}"
+    return f"{stem}_{res}.{ext}" if res == "thumb" else f"{stem}_{res}dpi.{ext}"
+
+
+@profiled("export")
+def export_figure(fig, stem, out_dir=".", formats=None, thumb_width=THUMB_WIDTH, **savefig_kwargs):
+    """
+    Write `fig` as <out_dir>/<stem>.<ext> in every requested format.
+
+    savefig_kwargs (bbox_inches, facecolor, pad_inches, ...) apply to
+    every format. Returns the output paths in format order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from PIL import Image, features
+
+    specs = parse_formats(formats)
+    rasters = [(e, r) for e, r in specs if e in RASTER]
+    if any(e == "webp" for e, _ in rasters) and not features.check("webp"):
+        warnings.warn("Pillow was built without WebP support; skipping WebP outputs")
+        specs = [(e, r) for e, r in specs if e != "webp"]
+        rasters = [(e, r) for e, r in rasters if e != "webp"]
+
+    savefig_kwargs.pop("dpi", None)
+    paths = {spec: os.path.join(out_dir, _output_name(stem, spec[0], spec[1], rasters))
+             for spec in specs}
+
+    def timed(output, step, func, *args, **kwargs):
+        start = time.perf_counter()
+        with stage(f"export.{step}"):
+            result = func(*args, **kwargs)
+        TIMINGS.append((stem, os.path.basename(output), step, time.perf_counter() - start))
+        return result
+
+    # --- one raster draw at the highest dpi ---
+    dpis = [r for _, r in rasters if r != "thumb"]
+    if rasters:
+        top = max(dpis, default=fig.dpi)
+
+        def draw():
+            # Raw RGBA of the cropped figure; its pixel size is read off
+            # the renderer passed to the draw event
+            sizes = []
+            cid = fig.canvas.mpl_connect(
+                "draw_event", lambda event: sizes.append((int(event.renderer.width),
+                                                          int(event.renderer.height))))
+            buf = io.BytesIO()
+            try:
+                fig.savefig(buf, format="rgba", dpi=top, **savefig_kwargs)
+            finally:
+                fig.canvas.mpl_disconnect(cid)
+            return Image.frombuffer("RGBA", sizes[-1], buf.getbuffer(), "raw", "RGBA", 0, 1)
+
+        base = timed(f"draw@{top}", "draw", draw)
+
+        def encode(spec):
+            ext, res = spec
+            if res == "thumb":
+                size = (thumb_width, round(base.height * thumb_width / base.width))
+                dpi = top * thumb_width / base.width
+            else:
+                size = (round(base.width * res / top), round(base.height * res / top))
+                dpi = res
+            img = base if size == base.size else base.resize(size, Image.LANCZOS, reducing_gap=3.0)
+            if ext == "png":
+                img.save(paths[spec], format="PNG", dpi=(dpi, dpi))
+            else:
+                img.save(paths[spec], format="WEBP", quality=90, method=4)
+
+        with ThreadPoolExecutor(min(len(rasters), os.cpu_count() or 1)) as pool:
+            list(pool.map(lambda spec: timed(paths[spec], "encode", encode, spec), rasters))
+
+    # --- vector passes ---
+    for ext, _ in specs:
+        if ext in VECTOR:
+            timed(paths[(ext, None)], "draw+write", fig.savefig, paths[(ext, None)],
+                  format=ext, **savefig_kwargs)
+
+    return [paths[spec] for spec in specs]
+
+
+def write_timing_report(path, rows=None):
+    """Write (figure, output, stage, seconds) timing rows as CSV."""
+    import csv
+
+    rows = TIMINGS if rows is None else rows
+    with open(path, "w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["figure", "output", "stage", "seconds"])
+        for figure, output, stage, seconds in rows:
+            writer.writerow([figure, output, stage, f"{seconds:.4f}"])
+    return path
@@ -0,0 +1,144 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Multi-parameter full-ladder fitting (batched Levenberg–Marquardt)
+# =====================================================
+#
+# Model for body i of a linear ladder:
+#
+#     pred_i = s · k_i · (slope_i · a_H + intercept_i)
+#
+#   s    global scale (1 = the published ladder in AU)
+#   a_H  Harmonia node
+#   k_i  per-node coefficient multiplier, fixed at 1 unless the node
+#        is listed in `free_nodes`; a fitted k_i rescales that node's
+#        Celtic literal, e.g. Mercury's 14/15 becomes k · 14/15
+#
+# Residuals and their Jacobian are analytic and evaluated for every
+# starting point at once, shapes (P, n) and (P, n, p). Each LM iteration
+# solves all P damped normal-equation systems in one batched call, so
+# hundreds of starts converge in milliseconds. Bodies without an
+# observed value (Harmonia) are excluded from the fit.
+
+from collections import namedtuple
+
+import numpy as np
+
+from .model import FULL_LADDER, A_H_SILVER
+from .profiling import profiled
+
+FitResult = namedtuple(
+    "FitResult",
+    ["params", "cost", "rmse", "converged", "n_iter", "param_names", "best"],
+)
+FitResult.__doc__ = """
+Result of fit_ladder() for P starting points and p parameters.
+
+params       (P, p) fitted parameters, ordered as param_names
+cost         (P,) half sum of squared (weighted) residuals
+rmse         (P,) root mean square residual over observed bodies
+converged    (P,) bool, relative step below tolerance
+n_iter       number of LM iterations performed
+param_names  ("s", "a_H", "k_<node>", ...)
+best         index of the lowest-cost start
+"""
+
+
+def _free_indices(free_nodes, ladder):
+    names = list(ladder.names)
+    unknown = [node for node in free_nodes if node not in names]
+    if unknown:
+        raise ValueError(f"Unknown ladder node(s): {', '.join(unknown)}")
+    return np.array([names.index(node) for node in free_nodes], dtype=int)
+
+
+def ladder_residuals(params, free_nodes=(), ladder=FULL_LADDER, relative=False):
+    """
+    Residuals and analytic Jacobian for a batch of parameter vectors.
+
+    params  (..., p) with p = 2 + len(free_nodes)
+
+    Returns (r, J) of shapes (..., n_bodies) and (..., n_bodies, p).
+    Unobserved bodies contribute zero residual and zero Jacobian rows.
+    If `relative`, residuals are (pred - obs) / obs instead of AU.
+    """
+    free = _free_indices(free_nodes, ladder)
+    params = np.asarray(params, dtype=float)
+    observed = np.asarray(ladder.observed, dtype=float)
+    n = observed.shape[-1]
+
+    mask = np.isfinite(observed)
+    obs = np.where(mask, observed, 0.0)
+    weight = mask.astype(float)
+    if relative:
+        weight = weight / np.where(mask, obs, 1.0)
+
+    s = params[..., 0:1]
+    a_H = params[..., 1:2]
+    k = np.ones(params.shape[:-1] + (n,))
+    k[..., free] = params[..., 2:]
+
+    base = ladder.slopes * a_H + ladder.intercepts          # (..., n)
+    r = weight * (s * k * base - obs)
+
+    J = np.zeros(params.shape[:-1] + (n, params.shape[-1]))
+    J[..., 0] = weight * k * base
+    J[..., 1] = weight * s * k * ladder.slopes
+    J[..., free, np.arange(2, 2 + len(free))] = (weight * s * base)[..., free]
+    return r, J
+
+
+@profiled("fit_ladder")
+def fit_ladder(starts=None, free_nodes=(), ladder=FULL_LADDER, relative=False,
+               n_starts=256, spread=0.05, seed=0, max_iter=100, tol=1e-12):
+    """
+    Jointly fit s, a_H and the selected node coefficients from many starts.
+
+    starts    (P, p) initial parameters; if None, n_starts points are
+              drawn around (s=1, a_H=a_H^Silver, k=1) with relative
+              log-normal scatter `spread`, from a seeded generator.
+    """
+    free_nodes = tuple(free_nodes)
+    p = 2 + len(free_nodes)
+    if starts is None:
+        rng = np.random.default_rng(seed)
+        centre = np.concatenate([[1.0, A_H_SILVER], np.ones(len(free_nodes))])
+        starts = centre * np.exp(spread * rng.standard_normal((n_starts, p)))
+    theta = np.array(starts, dtype=float, ndmin=2)
+    if theta.shape[-1] != p:
+        raise ValueError(f"starts must have {p} columns, got {theta.shape[-1]}")
+
+    n_obs = np.count_nonzero(np.isfinite(ladder.observed))
+    eye = np.eye(p)
+    lam = np.full(theta.shape[0], 1e-3)
+    converged = np.zeros(theta.shape[0], dtype=bool)
+
+    r, J = ladder_residuals(theta, free_nodes, ladder, relative)
+    cost = 0.5 * np.sum(r ** 2, axis=-1)
+
+    for n_iter in range(1, max_iter + 1):
+        JtJ = np.einsum("...ni,...nj->...ij", J, J)
+        Jtr = np.einsum("...ni,...n->...i", J, r)
+        diag = np.diagonal(JtJ, axis1=-2, axis2=-1)[..., np.newaxis] * eye
+        step = np.linalg.solve(JtJ + lam[:, None, None] * (diag + 1e-12 * eye),
+                               -Jtr[..., np.newaxis])[..., 0]
+
+        trial = theta + step
+        r_new, J_new = ladder_residuals(trial, free_nodes, ladder, relative)
+        cost_new = 0.5 * np.sum(r_new ** 2, axis=-1)
+
+        better = (cost_new <= cost) & ~converged
+        small = np.linalg.norm(step, axis=-1) <= tol * (np.linalg.norm(theta, axis=-1) + tol)
+
+        theta = np.where(better[:, None], trial, theta)
+        r = np.where(better[:, None], r_new, r)
+        J = np.where(better[:, None, None], J_new, J)
+        cost = np.where(better, cost_new, cost)
+        lam = np.where(better, lam / 3, lam * 4)
+
+        converged |= small
+        if converged.all():
+            break
+
+    rmse = np.sqrt(2 * cost / n_obs)
+    param_names = ("s", "a_H") + tuple(f"k_{node}" for node in free_nodes)
+    return FitResult(theta, cost, rmse, converged, n_iter, param_names, int(np.argmin(cost)))
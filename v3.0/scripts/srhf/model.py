@@ -0,0 +1,100 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Shared outer-system model and fit metrics
+# =====================================================
+#
+# Every v3.0 figure script evaluates the same outer-system ladder.
+# The functions below accept a scalar a_H or an ndarray of a_H values
+# and broadcast over it, so a full sweep is a single array expression:
+#
+#     a_range = np.linspace(2.12, 2.18, 2000)
+#     preds   = predict_outer(a_range)     # shape (2000, 5)
+#     rmses   = rmse(a_range)              # shape (2000,)
+#
+# A scalar a_H still returns a (5,) prediction vector and scalar metrics.
+
+from collections import namedtuple
+
+import numpy as np
+
+# --- Constants (SRHF geometry) ---
+A = np.sqrt(2)
+B = A + 1                # δ_S
+C = 2 * A - 1
+D = A - 1
+
+# --- Observed outer planets (AU) ---
+OUTER_PLANETS  = ("Jupiter", "Saturn", "Uranus", "Neptune", "Pluto")
+OUTER_OBSERVED = np.array([5.204, 9.559, 19.185, 30.156, 39.482])
+
+# --- Outer-planet / Harmonia ratios ---
+OUTER_RATIOS = np.array([
+    (1 + A),                    # Jupiter/Harmonia
+    C * (1 + A),                # Saturn/Harmonia
+    2 * C * (1 + A),            # Uranus/Harmonia
+    (B / D) * (1 + A),          # Neptune/Harmonia
+    2 * (A + B) * (1 + A)       # Pluto/Harmonia
+])
+
+# --- Full ten-body ladder (Mercury to Pluto) as a linear function of a_H ---
+# pred_i(a_H) = slope_i * a_H + intercept_i; the inner planets are fixed
+# Celtic Cross values, Harmonia is a_H itself and the outer planets scale
+# with a_H through OUTER_RATIOS. Harmonia has no observed value (NaN).
+Ladder = namedtuple("Ladder", ["names", "observed", "slopes", "intercepts"])
+
+FULL_LADDER = Ladder(
+    names=("Mercury", "Venus", "Earth", "Mars", "Harmonia") + OUTER_PLANETS,
+    observed=np.concatenate([[0.387, 0.722, 1.000, 1.524, np.nan], OUTER_OBSERVED]),
+    slopes=np.concatenate([[0.0, 0.0, 0.0, 0.0, 1.0], OUTER_RATIOS]),
+    intercepts=np.array([(14/15)*D, 1/A, 1.0, (B + D)/C, 0, 0, 0, 0, 0, 0]),
+)
+
+OUTER_LADDER = Ladder(
+    names=OUTER_PLANETS,
+    observed=OUTER_OBSERVED,
+    slopes=OUTER_RATIOS,
+    intercepts=np.zeros(len(OUTER_PLANETS)),
+)
+
+# --- Analytic SRHF candidates for the Harmonia node ---
+A_H_SILVER = (2 * A * C) / (1 + A)      # SRHF algebraic Silver-Ratio prediction
+A_H_PI     = np.pi ** (2 / 3)           # SRHF transcendental prediction
+
+
+def predict_outer(a_H, ratios=OUTER_RATIOS):
+    """
+    Predict outer-planet semi-major axes (AU)
+    as a function of the Harmonia node a_H.
+
+    Returns an array of shape a_H.shape + (5,).
+    """
+    a_H = np.asarray(a_H, dtype=float)
+    return a_H[..., np.newaxis] * ratios
+
+
+def residuals_pct(a_H, observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS):
+    """Percent residuals (pred - obs) / obs * 100, shape a_H.shape + (5,)."""
+    preds = predict_outer(a_H, ratios)
+    return (preds - observeds) / observeds * 100
+
+
+def rmse(a_H, observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS):
+    """Root mean square error (AU) over the outer planets."""
+    preds = predict_outer(a_H, ratios)
+    return np.sqrt(np.mean((preds - observeds) ** 2, axis=-1))
+
+
+def hsi(a_H, observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS):
+    """Harmonic Symmetry Index: σ of the percent residuals."""
+    return np.std(residuals_pct(a_H, observeds, ratios), axis=-1)
+
+
+def mape(a_H, observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS):
+    """Mean absolute percentage error (%) over the outer planets."""
+    return np.mean(np.abs(residuals_pct(a_H, observeds, ratios)), axis=-1)
+
+
+def predict_ladder(a_H, ladder=FULL_LADDER):
+    """Predict every body of a linear ladder, shape a_H.shape + (n_bodies,)."""
+    a_H = np.asarray(a_H, dtype=float)
+    return a_H[..., np.newaxis] * ladder.slopes + ladder.intercepts
@@ -0,0 +1,158 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Monte Carlo significance of the outer-system fit
+# =====================================================
+#
+# Asks how often a synthetic outer system, fitted the same way, reaches
+# a metric at least as good as the real SRHF fit. Two null models:
+#
+#   "ladders"    random ratio ladders: the four consecutive log-steps
+#                Jupiter→…→Pluto are drawn uniformly from `step_range`
+#                and scored against the observed planets
+#   "perturbed"  perturbed solar systems: the observed distances are
+#                jittered log-normally by `sigma` and scored against the
+#                SRHF ladder
+#
+# In both cases a_H is re-optimised per trial with the closed-form
+# solvers, so a trial costs a handful of array operations. By default a
+# trial is a hit when it beats the published fit of
+# scripts/celtic_full_system_verification.py (reference_metrics(): the
+# Silver-Ratio ladder at a_H^Silver, scored from Harmonia at 2.155 AU to
+# Pluto, outer MAPE 0.68%). Trials get their own optimum while the
+# reference does not, which only favours the null, so the p-value is
+# conservative. Trials are drawn in fixed-size chunks from independent
+# SeedSequence children: results depend only on `seed`, not on the
+# number of workers, and memory stays bounded by `chunk_size` ×
+# `workers` whatever the total trial count.
+
+import os
+from collections import namedtuple
+
+import numpy as np
+
+from .model import A_H_SILVER, OUTER_OBSERVED, OUTER_RATIOS
+from .optimize import rmse_optimum, mape_optimum
+from .profiling import profiled
+
+METRICS = ("rmse", "hsi", "mape")
+
+HARMONIA_EMPIRICAL = 2.155   # AU, as in celtic_full_system_verification.py
+
+MCEstimate = namedtuple("MCEstimate", ["trials", "hits", "p_value", "lower", "upper"])
+MCEstimate.__doc__ = """
+Running p-value estimate: hits / trials with a Clopper–Pearson interval.
+"""
+
+
+def outer_metrics(observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS):
+    """
+    Best-fit RMSE, HSI and MAPE per system, each of shape (...,).
+
+    RMSE and MAPE are taken at their own exact optima; HSI is evaluated
+    at the RMSE-optimal a_H (its unconstrained minimum is degenerate).
+    """
+    a_rmse, rmse, _ = rmse_optimum(observeds, ratios)
+    pct = (a_rmse[..., np.newaxis] * ratios / observeds - 1) * 100
+    hsi = np.std(pct, axis=-1)
+    mape = mape_optimum(observeds, ratios).value
+    return {"rmse": rmse, "hsi": hsi, "mape": mape}
+
+
+def reference_metrics():
+    """RMSE, HSI and MAPE of the published Harmonia–Pluto fit (MAPE 0.68%)."""
+    observed = np.concatenate([[HARMONIA_EMPIRICAL], OUTER_OBSERVED])
+    predicted = A_H_SILVER * np.concatenate([[1.0], OUTER_RATIOS])
+    pct = (predicted / observed - 1) * 100
+    return {"rmse": float(np.sqrt(np.mean((predicted - observed) ** 2))),
+            "hsi": float(np.std(pct)), "mape": float(np.mean(np.abs(pct)))}
+
+
+def draw_random_ladders(rng, n, step_range=(0.25, 0.75)):
+    """(n, 5) random outer ratio ladders with uniform log-steps."""
+    steps = rng.uniform(step_range[0], step_range[1], size=(n, 4))
+    log_ratios = np.concatenate([np.zeros((n, 1)), np.cumsum(steps, axis=1)], axis=1)
+    return OUTER_RATIOS[0] * np.exp(log_ratios)
+
+
+def draw_perturbed_systems(rng, n, sigma=0.05):
+    """(n, 5) observed outer systems with log-normal jitter sigma."""
+    return OUTER_OBSERVED * np.exp(sigma * rng.standard_normal((n, 5)))
+
+
+def _chunk_hits(args):
+    seed_seq, n, null, metric, threshold, null_kwargs = args
+    rng = np.random.default_rng(seed_seq)
+    if null == "ladders":
+        values = outer_metrics(OUTER_OBSERVED, draw_random_ladders(rng, n, **null_kwargs))
+    else:
+        values = outer_metrics(draw_perturbed_systems(rng, n, **null_kwargs), OUTER_RATIOS)
+    return n, int(np.count_nonzero(values[metric] <= threshold))
+
+
+def clopper_pearson(hits, trials, confidence=0.95):
+    """Exact binomial confidence interval for hits / trials."""
+    from scipy.stats import beta
+
+    alpha = 1 - confidence
+    lower = beta.ppf(alpha / 2, hits, trials - hits + 1) if hits > 0 else 0.0
+    upper = beta.ppf(1 - alpha / 2, hits + 1, trials - hits) if hits < trials else 1.0
+    return float(lower), float(upper)
+
+
+@profiled("montecarlo")
+def run_monte_carlo(n_trials, null="ladders", metric="mape", threshold=None,
+                    chunk_size=250_000, workers=None, seed=0, confidence=0.95,
+                    **null_kwargs):
+    """
+    Stream running p-value estimates, one MCEstimate per finished chunk.
+
+    threshold  metric value to beat; defaults to reference_metrics(), the
+               fit printed by celtic_full_system_verification.py
+    workers    process-pool size (None: os.cpu_count(); 1: in-process)
+    """
+    if null not in ("ladders", "perturbed"):
+        raise ValueError(f"Unknown null model: {null!r}")
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric: {metric!r}")
+    if threshold is None:
+        threshold = reference_metrics()[metric]
+
+    n_chunks = -(-n_trials // chunk_size)
+    children = np.random.SeedSequence(seed).spawn(n_chunks)
+    sizes = [min(chunk_size, n_trials - i * chunk_size) for i in range(n_chunks)]
+    tasks = ((children[i], sizes[i], null, metric, threshold, null_kwargs)
+             for i in range(n_chunks))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    trials = hits = 0
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as pool:
+            pending = []
+            for task in tasks:
+                pending.append(pool.submit(_chunk_hits, task))
+                if len(pending) < 2 * workers:
+                    continue
+                n, h = pending.pop(0).result()
+                trials, hits = trials + n, hits + h
+                yield MCEstimate(trials, hits, hits / trials, *clopper_pearson(hits, trials, confidence))
+            for future in pending:
+                n, h = future.result()
+                trials, hits = trials + n, hits + h
+                yield MCEstimate(trials, hits, hits / trials, *clopper_pearson(hits, trials, confidence))
+    else:
+        for task in tasks:
+            n, h = _chunk_hits(task)
+            trials, hits = trials + n, hits + h
+            yield MCEstimate(trials, hits, hits / trials, *clopper_pearson(hits, trials, confidence))
+
+
+def significance(n_trials, **kwargs):
+    """Final MCEstimate of run_monte_carlo() after all trials."""
+    estimate = None
+    for estimate in run_monte_carlo(n_trials, **kwargs):
+        pass
+    return estimate
@@ -0,0 +1,94 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Closed-form optima of the outer-system fit metrics
+# =====================================================
+#
+# Every outer-planet prediction is a_H * ratio_i, i.e. linear in a_H,
+# so the optima need no iterative search:
+#
+#   RMSE   minimised by the least-squares slope   Σ r·o / Σ r²
+#   MAPE   minimised by the weighted median of o/r with weights r/o
+#   HSI    equals 100·|a_H|·σ(r/o), linear in a_H, so its minimum over
+#          an interval sits on the bound closest to zero
+#   zeros  residual i vanishes at a_H = o_i / r_i
+#
+# All results are exact to machine precision and cost zero model
+# evaluations. Observed arrays may carry leading batch axes, e.g. an
+# (N, 5) stack of resampled or perturbed systems, which are solved
+# together in one call.
+
+from collections import namedtuple
+
+import numpy as np
+
+from .model import OUTER_PLANETS, OUTER_OBSERVED, OUTER_RATIOS
+
+Optimum = namedtuple("Optimum", ["a_H", "value", "curvature"])
+Optimum.__doc__ = """
+Location and value of a metric minimum.
+
+a_H        optimal Harmonia node (AU)
+value      metric at the optimum (AU for RMSE, % for HSI and MAPE)
+curvature  second derivative of the metric at a_H; for the
+           piecewise-linear MAPE it is the jump in slope at the
+           kink (%/AU), a measure of how sharp the minimum is
+"""
+
+
+def rmse_optimum(observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS):
+    """Exact RMSE minimum: a_H = Σ r·o / Σ r², with RMSE'' = Σ r² / (n·RMSE)."""
+    observeds = np.asarray(observeds, dtype=float)
+    n = observeds.shape[-1]
+    rr = np.sum(ratios * ratios, axis=-1)
+    a_H = np.sum(ratios * observeds, axis=-1) / rr
+    value = np.sqrt(np.mean((a_H[..., np.newaxis] * ratios - observeds) ** 2, axis=-1))
+    with np.errstate(divide="ignore"):
+        curvature = rr / (n * value)
+    return Optimum(a_H, value, curvature)
+
+
+def hsi_optimum(bounds=(2.12, 2.18), observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS):
+    """
+    Exact HSI minimum over the closed interval `bounds`.
+
+    HSI(a_H) = 100·|a_H|·σ(r/o) has no interior stationary point, so
+    the minimum is the point of `bounds` closest to a_H = 0.
+    """
+    observeds = np.asarray(observeds, dtype=float)
+    lo, hi = bounds
+    a_H = np.clip(0.0, lo, hi)
+    slope = 100 * np.std(ratios / observeds, axis=-1)
+    a_H = np.broadcast_to(a_H, slope.shape)[()]
+    return Optimum(a_H, np.abs(a_H) * slope, np.zeros_like(slope)[()])
+
+
+def mape_optimum(observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS):
+    """
+    Exact MAPE minimum as a weighted median.
+
+    MAPE(a_H) = (100/n) Σ k_i |a_H - 1/k_i| with k = r/o, so the
+    minimiser is the k-weighted median of the single-planet zeros 1/k.
+    """
+    observeds = np.asarray(observeds, dtype=float)
+    n = observeds.shape[-1]
+    k = ratios / observeds
+    zeros = 1 / k
+
+    order = np.argsort(zeros, axis=-1)
+    zeros_sorted = np.take_along_axis(zeros, order, axis=-1)
+    k_sorted = np.take_along_axis(k, order, axis=-1)
+    cum = np.cumsum(k_sorted, axis=-1)
+    half = 0.5 * cum[..., -1:]
+    idx = np.argmax(cum >= half, axis=-1)[..., np.newaxis]
+
+    a_H = np.take_along_axis(zeros_sorted, idx, axis=-1)[..., 0][()]
+    value = 100 / n * np.sum(k * np.abs(a_H[..., np.newaxis] - zeros), axis=-1)
+    curvature = 200 / n * np.take_along_axis(k_sorted, idx, axis=-1)[..., 0]
+    return Optimum(a_H, value, curvature)
+
+
+def residual_zero(body="Neptune", observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS):
+    """a_H at which one planet's residual changes sign: o_i / r_i."""
+    i = OUTER_PLANETS.index(body) if isinstance(body, str) else body
+    observeds = np.asarray(observeds, dtype=float)
+    return observeds[..., i] / ratios[..., i]
@@ -0,0 +1,69 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Lazy pyplot access with a headless batch mode
+# =====================================================
+#
+# Figure scripts import pyplot from here instead of from matplotlib:
+#
+#     from srhf.plotting import plt, show_or_close
+#
+# `plt` is a stand-in that imports matplotlib.pyplot on first use, so a
+# run that only prints numbers never pays the ~0.5 s matplotlib import.
+#
+# With SRHF_HEADLESS=1 in the environment (or after headless() is
+# called, as build_figures.py does in its workers) the Agg backend is
+# selected before pyplot is imported, so no GUI toolkit is loaded and no
+# window is ever opened. show_or_close() then closes every open figure
+# instead of blocking in plt.show(), and returns the output paths so
+# batch callers can collect them.
+#
+# This module is not imported by the srhf package itself; numbers-only
+# users of srhf never load matplotlib.
+
+import os
+import sys
+
+_HEADLESS = os.environ.get("SRHF_HEADLESS", "0") not in ("", "0")
+
+
+def headless():
+    """Switch to batch mode: Agg backend, figures closed instead of shown."""
+    global _HEADLESS
+    _HEADLESS = True
+    if "matplotlib" in sys.modules:
+        sys.modules["matplotlib"].use("Agg")
+
+
+def is_headless():
+    return _HEADLESS
+
+
+def pyplot():
+    """matplotlib.pyplot, imported (with the right backend) on first call."""
+    if "matplotlib.pyplot" not in sys.modules:
+        import matplotlib
+        if _HEADLESS:
+            matplotlib.use("Agg")
+    import matplotlib.pyplot
+    return matplotlib.pyplot
+
+
+class _LazyPyplot:
+    def __getattr__(self, name):
+        return getattr(pyplot(), name)
+
+    def __repr__(self):
+        return "<lazy matplotlib.pyplot>"
+
+
+plt = _LazyPyplot()
+
+
+def show_or_close(paths=()):
+    """plt.show() interactively; in headless mode close all figures. Returns paths."""
+    if "matplotlib.pyplot" in sys.modules:
+        if _HEADLESS:
+            pyplot().close("all")
+        else:
+            pyplot().show()
+    return list(paths)
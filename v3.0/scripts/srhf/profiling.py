@@ -0,0 +1,185 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Opt-in stage profiling
+# =====================================================
+#
+# Named stages wrap the expensive steps of the figure and audio scripts
+# (sweeps, optimisation, drawing, encoding, synthesis, WAV/MIDI output):
+#
+#     with stage("sweep"):
+#         ...
+#
+#     @profiled("sine_wave")
+#     def sine_wave(...): ...
+#
+# Profiling is off unless SRHF_PROFILE is set (or enable() is called, as
+# build_figures.py --profile does). When off, stage() returns a shared
+# no-op context manager and @profiled functions cost one extra call and
+# a flag check, so the hooks can stay in place.
+#
+# When on, every stage records wall time, CPU time (process) and the
+# tracemalloc peak above its starting allocation; nested stages are
+# handled (per thread; the tracemalloc peak is process-wide). At exit
+# the run is written as a Chrome trace-event JSON ("X" complete events),
+# which chrome://tracing, Perfetto and speedscope display as a flame
+# graph, and a per-stage summary goes to stderr.
+#
+#   SRHF_PROFILE=1       trace written to ./srhf_trace_<script>_<pid>.json
+#   SRHF_PROFILE=<dir>   trace written into <dir>
+#
+# tracemalloc makes pure-Python stages (matplotlib drawing in
+# particular) several times slower; SRHF_PROFILE_MEMORY=0 skips it and
+# records time only.
+
+import atexit
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+_SETTING = os.environ.get("SRHF_PROFILE", "")
+_ENABLED = _SETTING not in ("", "0")
+_NULL = contextlib.nullcontext()
+
+# Completed stages: (name, start, wall, cpu, peak_bytes, depth, thread id)
+_EVENTS = []
+_LOCAL = threading.local()      # per-thread stack of open stages
+_T0 = time.perf_counter()
+
+
+def enabled():
+    return _ENABLED
+
+
+def enable(write_at_exit=True, memory=None):
+    """Turn profiling on for this process (idempotent)."""
+    global _ENABLED
+    if memory is None:
+        memory = os.environ.get("SRHF_PROFILE_MEMORY", "1") != "0"
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if write_at_exit and not _ENABLED:
+        atexit.register(_write_at_exit)
+    _ENABLED = True
+
+
+class _Stage:
+    __slots__ = ("name", "start", "cpu", "base", "peak")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        stack = _LOCAL.__dict__.setdefault("stack", [])
+        current, peak = tracemalloc.get_traced_memory()
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, peak)
+        tracemalloc.reset_peak()
+        self.base = self.peak = current
+        stack.append(self)
+        self.cpu = time.process_time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter() - self.start
+        cpu = time.process_time() - self.cpu
+        stack = _LOCAL.stack
+        stack.pop()
+        peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, peak)
+        _EVENTS.append((self.name, self.start - _T0, wall, cpu, peak - self.base,
+                        len(stack), threading.get_ident()))
+        return False
+
+
+def stage(name):
+    """Context manager timing the named stage when profiling is on."""
+    return _Stage(name) if _ENABLED else _NULL
+
+
+def profiled(name):
+    """Decorator form of stage(); the switch is checked per call."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return func(*args, **kwargs)
+            with _Stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def events(reset=False):
+    """Recorded stages as dicts (and clear them if reset)."""
+    out = [{"name": name, "start": start, "wall": wall, "cpu": cpu, "peak_bytes": peak,
+            "depth": depth, "tid": tid}
+           for name, start, wall, cpu, peak, depth, tid in _EVENTS]
+    if reset:
+        del _EVENTS[:]
+    return out
+
+
+def trace_json(runs):
+    """Chrome trace-event document from {process label: events()}."""
+    trace = []
+    for pid, (label, evts) in enumerate(runs.items(), start=1):
+        trace.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                      "args": {"name": label}})
+        for e in evts:
+            trace.append({"name": e["name"], "cat": "srhf", "ph": "X", "pid": pid,
+                          "tid": e["tid"] % 2**31, "ts": e["start"] * 1e6, "dur": e["wall"] * 1e6,
+                          "args": {"cpu_ms": round(e["cpu"] * 1e3, 3),
+                                   "peak_kib": round(e["peak_bytes"] / 1024, 1)}})
+    return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+
+def write_trace(path, runs=None):
+    """Write runs ({label: events}, default: this process) as trace JSON."""
+    if runs is None:
+        runs = {os.path.basename(sys.argv[0]) or "python": events()}
+    with open(path, "w") as fh:
+        json.dump(trace_json(runs), fh)
+    return path
+
+
+def summary(evts=None):
+    """Per-stage totals: {name: (calls, wall, cpu, max peak bytes)}."""
+    totals = {}
+    for e in events() if evts is None else evts:
+        calls, wall, cpu, peak = totals.get(e["name"], (0, 0.0, 0.0, 0))
+        totals[e["name"]] = (calls + 1, wall + e["wall"], cpu + e["cpu"],
+                             max(peak, e["peak_bytes"]))
+    return totals
+
+
+def print_summary(evts=None, file=None):
+    file = file or sys.stderr
+    print(f"\n{'Stage':<32} {'Calls':>6} {'Wall (s)':>9} {'CPU (s)':>9} {'Peak (MiB)':>11}",
+          file=file)
+    print("-" * 71, file=file)
+    for name, (calls, wall, cpu, peak) in sorted(summary(evts).items(),
+                                                 key=lambda item: -item[1][1]):
+        print(f"{name:<32} {calls:6d} {wall:9.3f} {cpu:9.3f} {peak / 2**20:11.1f}", file=file)
+
+
+def _write_at_exit():
+    if not _EVENTS:
+        return
+    script = os.path.splitext(os.path.basename(sys.argv[0]))[0] or "python"
+    directory = _SETTING if _SETTING not in ("", "0", "1") else "."
+    os.makedirs(directory, exist_ok=True)
+    path = write_trace(os.path.join(directory, f"srhf_trace_{script}_{os.getpid()}.json"))
+    print_summary()
+    print(f"Profile trace: {path}", file=sys.stderr)
+
+
+if _ENABLED:
+    _ENABLED = False
+    enable()
@@ -0,0 +1,86 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Bootstrap and jackknife intervals for the Harmonia optimum
+# =====================================================
+#
+# Each resample is a set of planet indices. All resamples are stacked
+# into one (R, n) index matrix, the observed distances and ladder
+# ratios are gathered with it, and the closed-form least-squares
+# optimum is solved for every row in a single batched call. Tens of
+# thousands of bootstrap resamples take milliseconds.
+#
+# Statistics: a_H^opt (RMSE minimum), the minimum RMSE, and the HSI at
+# that optimum.
+
+from collections import namedtuple
+
+import numpy as np
+
+from .model import OUTER_OBSERVED, OUTER_RATIOS
+from .optimize import rmse_optimum
+from .profiling import profiled
+
+STATISTICS = ("a_H_opt", "rmse", "hsi")
+
+Interval = namedtuple("Interval", ["estimate", "lower", "upper", "se", "replicates"])
+Interval.__doc__ = """
+Point estimate, confidence bounds, standard error and the per-resample
+replicate values (for histograms or shaded bands in the figures).
+"""
+
+
+def resampled_statistics(index, observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS):
+    """a_H^opt, min RMSE and HSI for every row of an (R, m) index matrix."""
+    obs = observeds[index]
+    rat = ratios[index]
+    a_H, rmse, _ = rmse_optimum(obs, rat)
+    pct = (a_H[..., np.newaxis] * rat / obs - 1) * 100
+    return {"a_H_opt": a_H, "rmse": rmse, "hsi": np.std(pct, axis=-1)}
+
+
+@profiled("resample.bootstrap")
+def bootstrap(n_resamples=10_000, confidence=0.95, seed=0,
+              observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS):
+    """
+    Percentile bootstrap over planets (resampling with replacement).
+
+    Returns {statistic: Interval}.
+    """
+    n = len(observeds)
+    rng = np.random.default_rng(seed)
+    index = rng.integers(0, n, size=(n_resamples, n))
+    full = resampled_statistics(np.arange(n), observeds, ratios)
+    reps = resampled_statistics(index, observeds, ratios)
+
+    alpha = 1 - confidence
+    out = {}
+    for name in STATISTICS:
+        lower, upper = np.quantile(reps[name], [alpha / 2, 1 - alpha / 2])
+        out[name] = Interval(float(full[name]), lower, upper,
+                             np.std(reps[name], ddof=1), reps[name])
+    return out
+
+
+@profiled("resample.jackknife")
+def jackknife(confidence=0.95, observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS):
+    """
+    Leave-one-out jackknife: bias-corrected estimate and t-interval.
+
+    Returns {statistic: Interval}; replicates[i] omits planet i.
+    """
+    from scipy.stats import t
+
+    n = len(observeds)
+    index = np.array([np.delete(np.arange(n), i) for i in range(n)])
+    full = resampled_statistics(np.arange(n), observeds, ratios)
+    reps = resampled_statistics(index, observeds, ratios)
+
+    t_crit = t.ppf(0.5 + confidence / 2, n - 1)
+    out = {}
+    for name in STATISTICS:
+        mean = np.mean(reps[name])
+        estimate = n * full[name] - (n - 1) * mean
+        se = np.sqrt((n - 1) / n * np.sum((reps[name] - mean) ** 2))
+        out[name] = Interval(float(estimate), estimate - t_crit * se,
+                             estimate + t_crit * se, se, reps[name])
+    return out
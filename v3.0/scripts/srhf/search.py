@@ -0,0 +1,300 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Combinatorial ratio-expression search
+# =====================================================
+#
+# Enumerates every expression over the SRHF constants {A, B, C, D, π}
+# and small rationals p/q, combined with + − × ÷ up to a given depth
+# (number of operations), and ranks the best fits to each consecutive
+# planet ratio.
+#
+# The pipeline is numeric-first:
+#
+#   1. Levels 0 .. depth−1 are materialised as float arrays. Each
+#      sub-expression value is computed once from its two operand
+#      levels (memoised by level) and only its provenance (op, operand
+#      indices) is stored.
+#   2. Forms that are algebraically equal are deduplicated by value:
+#      log-values are quantised to ~1e-10 relative, and a value already
+#      reachable at a lower depth is dropped, so each level holds only
+#      new values, in the simplest form found first. np.unique leaves
+#      every level sorted, which doubles as its log-value index.
+#   3. The last level is never materialised. For each operand pair and
+#      operator, the partner value that would hit the target within the
+#      error bound is a closed window (e.g. y ∈ t(1±ε)/x for ×), found
+#      by binary search in the sorted index. Branches outside the bound
+#      are never formed.
+#   4. The final-level probes are split into chunks and fanned out over
+#      a process pool.
+#
+# Only values > 0 are kept (planet ratios are positive), and strings are
+# built only for the reported matches; no sympy work per candidate.
+
+import os
+from collections import namedtuple
+from fractions import Fraction
+from math import gcd
+
+import numpy as np
+
+from .model import A, B, C, D, FULL_LADDER
+from .profiling import profiled
+
+CONSTANTS = (("A", A), ("B", B), ("C", C), ("D", D), ("π", np.pi))
+OPS = ("+", "-", "*", "/")
+
+Match = namedtuple("Match", ["ratio", "observed", "expression", "value", "error_pct", "depth"])
+
+
+def small_rationals(max_int=4):
+    """Reduced fractions p/q with 1 ≤ p, q ≤ max_int, as (name, value)."""
+    out = []
+    for q in range(1, max_int + 1):
+        for p in range(1, max_int + 1):
+            if gcd(p, q) == 1:
+                out.append((str(Fraction(p, q)), p / q))
+    return out
+
+
+def consecutive_ratios(ladder=FULL_LADDER):
+    """Observed ratios of consecutive bodies, skipping unobserved ones."""
+    names = [n for n, o in zip(ladder.names, ladder.observed) if np.isfinite(o)]
+    obs = [o for o in ladder.observed if np.isfinite(o)]
+    return {f"{n1[:3]}/{n0[:3]}": o1 / o0
+            for n0, n1, o0, o1 in zip(names, names[1:], obs, obs[1:])}
+
+
+# =====================================================
+# Level construction
+# =====================================================
+Level = namedtuple("Level", ["values", "op", "left_level", "left", "right"])
+
+
+def _key(values):
+    return np.round(np.log(values) * 1e10).astype(np.int64)
+
+
+def _combine(x, y, op):
+    with np.errstate(all="ignore"):
+        if op == 0:
+            return np.add.outer(x, y)
+        if op == 1:
+            return np.subtract.outer(x, y)
+        if op == 2:
+            return np.multiply.outer(x, y)
+        return np.divide.outer(x, y)
+
+
+def build_levels(leaves, depth):
+    """Materialise deduplicated, value-sorted levels 0 .. depth."""
+    values = np.array([v for _, v in leaves], dtype=float)
+    keys, first = np.unique(_key(values), return_index=True)
+    n = len(first)
+    levels = [Level(values[first], np.full(n, -1, np.int8), np.full(n, -1, np.int8),
+                    first.astype(np.int64), np.full(n, -1, np.int64))]
+    seen = keys
+
+    for d in range(1, depth + 1):
+        vals, ops, lls, ls, rs = [], [], [], [], []
+        for i in range(d):
+            j = d - 1 - i
+            for op in range(4):
+                v = _combine(levels[i].values, levels[j].values, op).ravel()
+                keep = np.flatnonzero(np.isfinite(v) & (v > 0))
+                l_idx, r_idx = np.divmod(keep, len(levels[j].values))
+                vals.append(v[keep])
+                ops.append(np.full(keep.size, op, np.int8))
+                lls.append(np.full(keep.size, i, np.int8))
+                ls.append(l_idx)
+                rs.append(r_idx)
+
+        v = np.concatenate(vals)
+        keys, first = np.unique(_key(v), return_index=True)
+        new = ~np.isin(keys, seen, assume_unique=True)
+        first = first[new]
+        seen = np.union1d(seen, keys[new])
+        levels.append(Level(v[first], np.concatenate(ops)[first], np.concatenate(lls)[first],
+                            np.concatenate(ls)[first], np.concatenate(rs)[first]))
+    return levels
+
+
+def format_expression(levels, leaves, level, idx):
+    """Render one stored expression as text."""
+    lv = levels[level]
+    if level == 0:
+        return leaves[lv.left[idx]][0]
+    i = int(lv.left_level[idx])
+    j = level - 1 - i
+    left = format_expression(levels, leaves, i, lv.left[idx])
+    right = format_expression(levels, leaves, j, lv.right[idx])
+    return f"{_operand(left, i)}{OPS[lv.op[idx]]}{_operand(right, j)}"
+
+
+def _operand(text, level):
+    """Parenthesise compound operands and fractional leaves."""
+    return text if level == 0 and "/" not in text else f"({text})"
+
+
+# =====================================================
+# Final-level search against the sorted index
+# =====================================================
+def _window(op, probe_left, p, t, eps):
+    """Interval the indexed operand q must lie in for p∘q (or q∘p) ≈ t."""
+    lo_t, hi_t = t * (1 - eps), t * (1 + eps)
+    if op == 0:
+        return lo_t - p, hi_t - p
+    if op == 2:
+        return lo_t / p, hi_t / p
+    if op == 1:
+        return (p - hi_t, p - lo_t) if probe_left else (lo_t + p, hi_t + p)
+    return (p / hi_t, p / lo_t) if probe_left else (lo_t * p, hi_t * p)
+
+
+def _apply(op, probe_left, p, q):
+    x, y = (p, q) if probe_left else (q, p)
+    return (x + y, x - y, x * y, x / y)[op]
+
+
+_LEVELS = None
+
+
+def _init_worker(levels):
+    global _LEVELS
+    _LEVELS = levels
+
+
+def _search_task(task):
+    """Search one chunk of probes; returns candidate rows per target."""
+    (p_level, q_level, op, probe_left, start, stop, targets, eps, top) = task
+    p = _LEVELS[p_level].values[start:stop]
+    q_index = np.log(_LEVELS[q_level].values)
+    out = []
+    for t in targets:
+        lo, hi = _window(op, probe_left, p, t, eps)
+        with np.errstate(all="ignore"):
+            i0 = np.searchsorted(q_index, np.log(np.maximum(lo, 1e-300)), "left")
+            i1 = np.searchsorted(q_index, np.log(np.maximum(hi, 1e-300)), "right")
+        i1 = np.where(hi > 0, i1, i0)
+        counts = i1 - i0
+        if counts.sum() == 0:
+            out.append(np.empty((0, 3)))
+            continue
+        probe = np.repeat(np.arange(p.size), counts)
+        q_idx = np.repeat(i0 - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        value = _apply(op, probe_left, p[probe], _LEVELS[q_level].values[q_idx])
+        err = np.abs(value / t - 1)
+        if err.size > top:
+            keep = np.argpartition(err, top)[:top]
+            err, probe, q_idx = err[keep], probe[keep], q_idx[keep]
+        out.append(np.column_stack([err, probe + start, q_idx]))
+    return (p_level, q_level, op, probe_left), out
+
+
+@profiled("search_ratios")
+def search_ratios(targets=None, depth=3, max_error_pct=1.0, top=10,
+                  leaves=None, workers=None, chunk=20000):
+    """
+    Ranked best-fitting expressions for each target ratio.
+
+    targets        {name: observed ratio}; defaults to the consecutive
+                   planet ratios of the full ladder
+    depth          maximum number of binary operations
+    max_error_pct  error bound; anything worse is pruned
+    leaves         [(name, value)]; defaults to CONSTANTS + small_rationals()
+    workers        process-pool size (None: os.cpu_count(); 1: in-process)
+
+    Returns {name: [Match, ...]} sorted by error, then depth.
+    """
+    if targets is None:
+        targets = consecutive_ratios()
+    if leaves is None:
+        leaves = list(CONSTANTS) + small_rationals()
+    names = list(targets)
+    t = np.array([targets[n] for n in names], dtype=float)
+    eps = max_error_pct / 100
+
+    levels = build_levels(leaves, max(depth - 1, 0))
+    rows = {n: [] for n in names}   # (err, depth, level, idx | final-level spec)
+
+    # Direct matches within the materialised levels
+    for d, lv in enumerate(levels):
+        for n, tv in zip(names, t):
+            err = np.abs(lv.values / tv - 1)
+            for k in np.flatnonzero(err <= eps):
+                rows[n].append((err[k], d, ("level", d, k)))
+
+    # Final level: probe the smaller operand level, search the larger
+    tasks = []
+    if depth >= 1:
+        for i in range(depth):
+            j = depth - 1 - i
+            for op in range(4):
+                if op in (0, 2) and i > j:
+                    continue
+                probe_left = levels[i].values.size <= levels[j].values.size
+                p_level, q_level = (i, j) if probe_left else (j, i)
+                n_p = levels[p_level].values.size
+                for start in range(0, n_p, chunk):
+                    tasks.append((p_level, q_level, op, probe_left,
+                                  start, min(start + chunk, n_p), t, eps, top))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(levels,)) as pool:
+            results = list(pool.map(_search_task, tasks))
+    else:
+        _init_worker(levels)
+        results = [_search_task(task) for task in tasks]
+
+    for spec, per_target in results:
+        for n, arr in zip(names, per_target):
+            for err, pi, qi in arr:
+                rows[n].append((err, depth, ("final",) + spec + (int(pi), int(qi))))
+
+    return {n: _rank(rows[n], n, tv, levels, leaves, top) for n, tv in zip(names, t)}
+
+
+def _rank(rows, name, target, levels, leaves, top):
+    rows.sort(key=lambda r: (r[0], r[1]))
+    matches, seen = [], set()
+    for err, d, ref in rows:
+        if ref[0] == "level":
+            _, level, k = ref
+            value = levels[level].values[k]
+            expr = format_expression(levels, leaves, level, k)
+        else:
+            _, p_level, q_level, op, probe_left, pi, qi = ref
+            p_val, q_val = levels[p_level].values[pi], levels[q_level].values[qi]
+            value = _apply(op, probe_left, p_val, q_val)
+            p_txt = format_expression(levels, leaves, p_level, pi)
+            q_txt = format_expression(levels, leaves, q_level, qi)
+            p_txt, q_txt = _operand(p_txt, p_level), _operand(q_txt, q_level)
+            left, right = (p_txt, q_txt) if probe_left else (q_txt, p_txt)
+            expr = f"{left}{OPS[op]}{right}"
+        key = int(_key(np.array([value]))[0])
+        if key in seen:
+            continue
+        seen.add(key)
+        matches.append(Match(name, target, expr, value, 100 * (value / target - 1), d))
+        if len(matches) == top:
+            break
+    return matches
+
+
+def format_table(results):
+    """Plain-text ranked table of search_ratios() output."""
+    rows = [(name, m) for name, matches in results.items() for m in matches]
+    nw = max([len("Ratio")] + [len(name) for name in results])
+    ew = max([len("Expression")] + [len(m.expression) for _, m in rows])
+    header = (f"{'Ratio':<{nw}} {'Observed':>9}  {'Expression':<{ew}} "
+              f"{'Value':>9} {'Dev':>9} {'Depth':>5}")
+    lines = [header, "-" * len(header)]
+    for name, matches in results.items():
+        for m in matches:
+            lines.append(f"{name:<{nw}} {m.observed:9.4f}  {m.expression:<{ew}} {m.value:9.4f} "
+                         f"{m.error_pct:+8.4f}% {m.depth:5d}")
+        lines.append("")
+    return "\n".join(lines)
@@ -0,0 +1,112 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Shared figure style: palette, background, grid, labels
+# =====================================================
+#
+# The v3.0 figures share one look: the SRHF palette, a #f8f8f8
+# background with a light grid drawn behind the data, and the same
+# mathtext labels for the Harmonia candidates. The constants below are
+# the single source for those values; style_axes() applies the
+# background and grid to a figure exactly as the scripts did by hand.
+#
+# use() loads everything matplotlib needs for these figures once per
+# process:
+#
+#   - the rcParams in RC, validated once and reapplied from a cache
+#   - the sans-serif, serif and mathtext fonts (FT2Font objects are
+#     cached by matplotlib after first use)
+#   - the mathtext grammar, built once per process by matplotlib's
+#     public MathTextParser, with the glyphs of the recurring labels
+#     loaded through it
+#
+# Only public matplotlib API is used; the caches are matplotlib's own.
+# build_figures.py calls use() before it forks its workers, so every
+# worker starts with the fonts and the mathtext grammar already loaded.
+
+import functools
+
+# --- SRHF palette ---
+INDIGO = "#2B2F8A"           # SRHF model / RMSE
+GOLD = "#D4AF37"             # HSI
+CRIMSON = "#B22222"          # empirical optimum a_H^opt
+TEAL = "#1F7A8C"             # transcendental prediction a_H^pi
+SRHF_ALGEBRAIC = "#E07A1A"   # algebraic Silver-Ratio prediction a_H^Silver
+ROBIN_EGG_BLUE = "#1FCECB"   # observed planets
+
+PLANET_COLORS = {
+    "Jupiter": "#4169E1",
+    "Saturn":  "#DAA520",
+    "Uranus":  "#40E0D0",
+    "Neptune": "#4682B4",
+    "Pluto":   "#CD5C5C",
+}
+
+# --- Background and grid ---
+BG = "#f8f8f8"
+GRID_COLOR = "#e0e0e0"
+GRID = {"color": GRID_COLOR, "linewidth": 1.0, "alpha": 0.85}
+
+# --- Recurring labels ---
+XLABEL_A_H = r"Harmonia semi-major axis $a_H$ (AU)"
+TEX_A_H_OPT = r"$a_H^{\mathrm{opt}}$"
+TEX_A_H_SILVER = r"$a_H^{\mathrm{Silver}}$"
+TEX_A_H_PI = r"$a_H^{\pi}$"
+
+LABELS = (XLABEL_A_H, TEX_A_H_OPT, TEX_A_H_SILVER, TEX_A_H_PI,
+          r"RMSE vs $a_H$", r"$|\mathrm{Residuals}|$ (%) [log scale]")
+
+# rcParams shared by every figure (applied by use()). axes.facecolor is
+# left out: legends take their face colour from it, and the published
+# figures have white legends on the grey axes.
+RC = {
+    "figure.facecolor": BG,
+    "savefig.facecolor": BG,
+    "axes.axisbelow": True,
+    "grid.color": GRID_COLOR,
+    "grid.linewidth": GRID["linewidth"],
+    "grid.alpha": GRID["alpha"],
+}
+
+# Font sizes and dpis the recurring labels are drawn at
+_WARM_SIZES = (10, 12)
+_WARM_DPIS = (100, 300)
+
+
+def style_axes(fig, *axes, **grid):
+    """SRHF background on fig and axes, grid (GRID updated by `grid`) behind the data."""
+    fig.patch.set_facecolor(BG)
+    for ax in axes:
+        ax.set_facecolor(BG)
+        ax.set_axisbelow(True)
+        ax.grid(True, **{**GRID, **grid})
+
+
+@functools.lru_cache(maxsize=None)
+def _rc():
+    import matplotlib
+
+    return matplotlib.RcParams(RC)
+
+
+@functools.lru_cache(maxsize=None)
+def _warm():
+    from matplotlib.font_manager import FontProperties, findfont, get_font
+    from matplotlib.mathtext import MathTextParser
+
+    for family in ("sans-serif", "serif"):
+        get_font(findfont(FontProperties(family=[family])))
+    parser = MathTextParser("path")   # the parser type RendererAgg uses
+    for label in LABELS:
+        for size in _WARM_SIZES:
+            for dpi in _WARM_DPIS:
+                parser.parse(label, dpi, FontProperties(size=size))
+
+
+def use(rc=True):
+    """Load fonts and the mathtext grammar once; apply RC if `rc`."""
+    from .plotting import pyplot
+
+    pyplot()
+    _warm()
+    if rc:
+        pyplot().rcParams.update(_rc())
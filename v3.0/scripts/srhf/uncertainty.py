@@ -0,0 +1,139 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Propagation of observational uncertainty
+# =====================================================
+#
+# The observed semi-major axes carry an error model: per-body σ or a
+# full covariance Σ (AU²). By default σ is the rounding error of the
+# three-decimal values, 0.0005/√3 AU. The uncertainty is propagated to
+#
+#   a_H_opt      RMSE-optimal node (or a fixed a_H, which has no spread)
+#   predictions  outer-planet predictions at that node
+#   residuals    predictions − observed (AU)
+#   rmse, hsi    fit metrics at that node
+#
+# in two ways:
+#
+#   linearized()  first-order (delta method): analytic Jacobians J and
+#                 covariance J Σ Jᵀ for every quantity
+#   sampled()     Monte Carlo: correlated draws o + L z (Σ = L Lᵀ) are
+#                 pushed through the batched closed-form solver in
+#                 fixed-size chunks; 10⁶ draws are a few (N, 5) arrays
+#                 and no per-draw Python objects
+
+from collections import namedtuple
+
+import numpy as np
+
+from .model import OUTER_OBSERVED, OUTER_RATIOS
+from .optimize import rmse_optimum
+from .profiling import profiled
+
+ROUNDING_SIGMA = 0.0005 / np.sqrt(3)
+
+QUANTITIES = ("a_H_opt", "predictions", "residuals", "rmse", "hsi")
+
+Propagated = namedtuple("Propagated", ["mean", "std", "cov"])
+Propagated.__doc__ = """
+Nominal value with first-order standard deviation and covariance
+(a scalar variance for scalar quantities).
+"""
+
+
+def observation_covariance(sigma=None, cov=None, observeds=OUTER_OBSERVED):
+    """Σ from a full covariance, per-body σ, a common σ, or the rounding default."""
+    if cov is not None:
+        return np.asarray(cov, dtype=float)
+    if sigma is None:
+        sigma = ROUNDING_SIGMA
+    sigma = np.broadcast_to(np.asarray(sigma, dtype=float), np.shape(observeds))
+    return np.diag(sigma ** 2)
+
+
+def outer_quantities(observeds=OUTER_OBSERVED, a_H=None, ratios=OUTER_RATIOS):
+    """All propagated quantities for a batch of observed systems (..., 5)."""
+    observeds = np.asarray(observeds, dtype=float)
+    if a_H is None:
+        a_H = rmse_optimum(observeds, ratios).a_H
+    else:
+        a_H = np.broadcast_to(np.asarray(a_H, dtype=float), observeds.shape[:-1])
+    preds = a_H[..., np.newaxis] * ratios
+    resid = preds - observeds
+    pct = (preds / observeds - 1) * 100
+    return {
+        "a_H_opt": a_H,
+        "predictions": preds,
+        "residuals": resid,
+        "rmse": np.sqrt(np.mean(resid ** 2, axis=-1)),
+        "hsi": np.std(pct, axis=-1),
+    }
+
+
+@profiled("uncertainty.linearized")
+def linearized(sigma=None, cov=None, a_H=None, observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS):
+    """
+    First-order propagation, {quantity: Propagated}.
+
+    a_H  None to re-optimise the node per realisation (RMSE optimum);
+         a fixed value (e.g. A_H_SILVER) holds it constant
+    """
+    observeds = np.asarray(observeds, dtype=float)
+    S = observation_covariance(sigma, cov, observeds)
+    n = observeds.size
+    nominal = outer_quantities(observeds, a_H, ratios)
+
+    grad_a = ratios / np.dot(ratios, ratios) if a_H is None else np.zeros(n)
+    J_pred = np.outer(ratios, grad_a)
+    J_resid = J_pred - np.eye(n)
+    resid = nominal["residuals"]
+    grad_rmse = J_resid.T @ resid / (n * nominal["rmse"])
+
+    pct = (nominal["predictions"] / observeds - 1) * 100
+    J_pct = 100 * (J_pred / observeds[:, np.newaxis] - np.diag(nominal["predictions"] / observeds ** 2))
+    grad_hsi = J_pct.T @ (pct - pct.mean()) / (n * nominal["hsi"])
+
+    jacobians = {"a_H_opt": grad_a, "predictions": J_pred, "residuals": J_resid,
+                 "rmse": grad_rmse, "hsi": grad_hsi}
+    out = {}
+    for name in QUANTITIES:
+        J = jacobians[name]
+        c = J @ S @ J.T
+        std = np.sqrt(np.diagonal(c)) if np.ndim(c) else np.sqrt(c)
+        out[name] = Propagated(nominal[name][()], std, c)
+    return out
+
+
+@profiled("uncertainty.sampled")
+def sampled(n_draws=1_000_000, sigma=None, cov=None, a_H=None, seed=0, chunk_size=250_000,
+            observeds=OUTER_OBSERVED, ratios=OUTER_RATIOS):
+    """
+    Monte Carlo propagation, {quantity: samples} with samples of shape
+    (n_draws,) or (n_draws, 5), filled chunk by chunk into preallocated
+    arrays.
+    """
+    observeds = np.asarray(observeds, dtype=float)
+    # eigh factor: unlike Cholesky it accepts singular PSD covariances
+    # (zero sigmas, perfectly correlated observations), as linearized() does
+    w, V = np.linalg.eigh(observation_covariance(sigma, cov, observeds))
+    L = V * np.sqrt(np.clip(w, 0, None))
+    rng = np.random.default_rng(seed)
+    n = observeds.size
+
+    out = {name: np.empty((n_draws, n) if name in ("predictions", "residuals") else n_draws)
+           for name in QUANTITIES}
+    for start in range(0, n_draws, chunk_size):
+        stop = min(start + chunk_size, n_draws)
+        draws = observeds + rng.standard_normal((stop - start, n)) @ L.T
+        for name, values in outer_quantities(draws, a_H, ratios).items():
+            out[name][start:stop] = values
+    return out
+
+
+def summarize(samples, confidence=0.95):
+    """{quantity: (mean, std, lower, upper)} from sampled() output."""
+    alpha = 1 - confidence
+    return {
+        name: (values.mean(axis=0), values.std(axis=0, ddof=1),
+               *np.quantile(values, [alpha / 2, 1 - alpha / 2], axis=0))
+        for name, values in samples.items()
+    }
@@ -0,0 +1,53 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Asteroid density around the SRHF nodes and the Kirkwood gaps
+# Usage: python srhf_belt_density.py [MPCORB.DAT]
+# Console output: objects within ±δ of each ladder node, KDE peak
+# statistics at the nodes and gap statistics at the Kirkwood gaps
+# =====================================================
+
+import sys
+
+from srhf import (SortedAxes, gap_statistics, histogram_profile, kde_profile,
+                  kirkwood_gaps, ladder_nodes, load_catalog, node_statistics)
+
+# --- Analysis settings (AU) ---
+A_RANGE   = (1.8, 3.6)     # profile range: Hungarias to the 2:1 gap
+KDE_STEP  = 1e-4
+BANDWIDTH = 2e-3
+HIST_STEP = 1e-3
+DELTAS    = (0.001, 0.005, 0.01, 0.05)
+
+
+if __name__ == "__main__":
+    catalog = load_catalog(sys.argv[1] if len(sys.argv) > 1 else None)
+    if catalog is None:
+        sys.exit("No asteroid catalog: pass MPCORB.DAT or set SRHF_MPCORB")
+    a = catalog["a"]
+    index = SortedAxes(a)
+    print(f"\n=== SRHF belt density ({len(index):,} orbits) ===")
+
+    # --- Counts within ±δ of each node (and gap) ---
+    positions = {**ladder_nodes(), **{f"Kirkwood {k}": v for k, v in kirkwood_gaps().items()}}
+    print(f"\n{'Position':<16} {'a (AU)':>9} " + " ".join(f"{'±' + str(d):>10}" for d in DELTAS))
+    print("-" * (27 + 11 * len(DELTAS)))
+    for name, a_node in sorted(positions.items(), key=lambda item: item[1]):
+        if A_RANGE[0] <= a_node <= A_RANGE[1]:
+            counts = index.within([a_node] * len(DELTAS), DELTAS)
+            print(f"{name:<16} {a_node:9.4f} " + " ".join(f"{c:10d}" for c in counts))
+
+    # --- Density profiles ---
+    kde = kde_profile(a, *A_RANGE, step=KDE_STEP, bandwidth=BANDWIDTH)
+    hist = histogram_profile(a, *A_RANGE, step=HIST_STEP)
+    print(f"\nKDE: {kde.a.size} points, step {KDE_STEP} AU, bandwidth {BANDWIDTH} AU; "
+          f"histogram: {hist.a.size} bins of {HIST_STEP} AU")
+
+    for title, stats in (("SRHF nodes (peaks)", node_statistics(kde)),
+                         ("Kirkwood gaps", gap_statistics(kde))):
+        print(f"\n{title}")
+        print(f"{'':<10} {'Nominal':>9} {'Extremum':>9} {'dN/da':>11} {'At nominal':>11} "
+              f"{'Background':>11} {'Contrast':>9} {'Width':>8}")
+        print("-" * 86)
+        for name, f in stats.items():
+            print(f"{name:<10} {f.nominal:9.4f} {f.a:9.4f} {f.density:11.0f} {f.at_nominal:11.0f} "
+                  f"{f.background:11.0f} {f.contrast:9.3f} {f.width:8.4f}")
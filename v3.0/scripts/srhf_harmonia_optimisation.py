@@ -1,141 +1,150 @@
 # =====================================================
 # SRHF Harmonia Optimisation Script
 # Output: srhf_harmonia_optimisation.png (Figure 3a)
+# Usage: python srhf_harmonia_optimisation.py [--uncertainty]
+# --uncertainty adds the 95% intervals of the optimum and the propagated
+# observational uncertainty to the console summary (kept out of figure
+# builds)
 # =====================================================
 
-import numpy as np
-import matplotlib.pyplot as plt
-from scipy.optimize import minimize_scalar
-
-# Silver Ratio constants (SRHF)
-A = np.sqrt(2)
-B = A + 1                # δ_S
-C = 2*A - 1
-D = A - 1
-
-# Observed outer planets (AU)
-observeds = [5.204, 9.559, 19.185, 30.156, 39.482]
-planet_names = ["Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
-
-
-# =====================================================
-# SRHF outer-system prediction function
-# =====================================================
-def predict_outer_fixed_ratios(a_H):
-    ratios = [
-        (1 + A),                    # Jupiter/Harmonia
-        C * (1 + A),                # Saturn/Harmonia
-        2 * C * (1 + A),            # Uranus/Harmonia
-        (B / D) * (1 + A),          # Neptune/Harmonia
-        2 * (A + B) * (1 + A)       # Pluto/Harmonia
-    ]
-    return [a_H * ratio for ratio in ratios]
-
-
-# =====================================================
-# RMSE computation
-# =====================================================
-def rmse_fixed_ratios(a_H):
-    preds = predict_outer_fixed_ratios(a_H)
-    return np.sqrt(np.mean([(p - o)**2 for p, o in zip(preds, observeds)]))
-
-
-# =====================================================
-# Optimisation sweep
-# =====================================================
-a_H_range = np.linspace(2.12, 2.18, 1000)
-rmses = [rmse_fixed_ratios(a) for a in a_H_range]
-
-result = minimize_scalar(rmse_fixed_ratios, bounds=(2.12, 2.18), method='bounded')
-optimal_a_H = result.x
-min_rmse = result.fun
-
-# SRHF comparison values
-srhf_algebraic = (2*A*C) / (1 + A)
-srhf_transcendental = np.pi**(2/3)
-
-
-# =====================================================
-# Print summary
-# =====================================================
-print("\n=== SRHF Harmonia Optimisation Results ===")
-print(f"Optimal a_H (empirical):                 {optimal_a_H:.9f} AU")
-print(f"SRHF algebraic prediction a_H^Silver:    {srhf_algebraic:.9f} AU")
-print(f"SRHF transcendental prediction a_H^π:    {srhf_transcendental:.9f} AU")
-print(f"Minimum RMSE:                            {min_rmse:.9f} AU")
-
-# Predictions with empirical optimum
-preds_opt = predict_outer_fixed_ratios(optimal_a_H)
-
-print("\nPredicted outer planets at optimum:")
-for name, pred, obs in zip(planet_names, preds_opt, observeds):
-    print(f"{name:<8}: {pred:.3f} AU   (obs: {obs:.3f} AU)")
+import sys
 
-
-# =====================================================
-# Colours (SRHF palette)
-# =====================================================
-indigo = "#2B2F8A"
-teal = "#1F7A8C"
-crimson = "#B22222"
-srhf_algebraic_color = "#E07A1A"   # gold/amber for SRHF-algebraic marker
-
-# =====================================================
-# Plot Harmonia optimisation curve
-# =====================================================
-
-fig, ax = plt.subplots(figsize=(9, 6.5))
-
-# Background color
-bg = "#f8f8f8"
-ax.set_facecolor(bg)
-fig.patch.set_facecolor(bg)
-
-# Light grey grid behind all elements
-ax.set_axisbelow(True)
-ax.grid(
-    True,
-    color="#e0e0e0",      # Same grid color as your other plot
-    linewidth=1.0,
-    alpha=0.85
-)
-
-ax.plot(a_H_range, rmses, color=indigo, linewidth=2, label=r"RMSE vs $a_H$")
-
-# Empirical optimum
-ax.axvline(
-    optimal_a_H, color=crimson, linestyle='--', linewidth=2,
-    label=rf"$a_H^{{\mathrm{{opt}}}} = {optimal_a_H:.6f}\,$AU"
-)
-
-# SRHF transcendental prediction
-ax.axvline(
-    srhf_transcendental, color=teal, linestyle=':', linewidth=2,
-    label=rf"$a_H^{{\pi}} = {srhf_transcendental:.6f}\,$AU"
-)
-
-# SRHF algebraic prediction
-ax.axvline(
-    srhf_algebraic, color=srhf_algebraic_color, linestyle='-.', linewidth=2,
-    label=rf"$a_H^{{\mathrm{{Silver}}}} = {srhf_algebraic:.6f}\,$AU"
+import numpy as np
+from srhf.plotting import plt, show_or_close
+from srhf.export import export_figure
+from srhf.profiling import profiled
+from srhf.style import INDIGO, CRIMSON, TEAL, SRHF_ALGEBRAIC, XLABEL_A_H, style_axes, use
+from srhf.data import save_dataset, sweep_columns, candidate_columns
+
+# SRHF outer-system model and RMSE (shared engine)
+from srhf import (
+    A, C,
+    OUTER_PLANETS as planet_names,
+    OUTER_OBSERVED as observeds,
+    predict_outer, sweep,
+    rmse_optimum, bootstrap, jackknife,
+    propagate_linearized, propagate_sampled, summarize_samples,
 )
 
-ax.set_xlabel(r"Harmonia semi-major axis $a_H$ (AU)", fontsize=12)
-ax.set_ylabel("Root Mean Square Error (AU)", fontsize=12)
-ax.set_title("SRHF Harmonic Model – Optimisation of Harmonia's Position", fontsize=14)
-ax.legend(fontsize=9)
-
-plt.tight_layout()
-plt.savefig("srhf_harmonia_optimisation.png", dpi=300, bbox_inches='tight')
-plt.show()
-
-
-# =====================================================
-# Differences from optimum
-# =====================================================
-print("\nDifferences from empirical optimum:")
-print(f"Transcendental |a_H^π - a_H^opt|: {abs(srhf_transcendental - optimal_a_H):.6f} AU "
-      f"({abs(srhf_transcendental - optimal_a_H) / optimal_a_H * 100:.3f}%)")
 
-print(f"Algebraic      |a_H^Silver - a_H^opt|: {abs(srhf_algebraic - optimal_a_H):.6f} AU "
-      f"({abs(srhf_algebraic - optimal_a_H) / optimal_a_H * 100:.3f}%)")
+def report_resampling():
+    """95% bootstrap and jackknife intervals of a_H^opt, RMSE and HSI."""
+    boot = bootstrap(n_resamples=20_000)
+    jack = jackknife()
+
+    print("\n95% intervals (bootstrap percentile | jackknife t):")
+    for key, label, unit in [("a_H_opt", "a_H^opt", "AU"), ("rmse", "Min RMSE", "AU"), ("hsi", "HSI", "%")]:
+        b, j = boot[key], jack[key]
+        print(f"{label:<9} [{b.lower:.6f}, {b.upper:.6f}] {unit} | "
+              f"[{j.lower:.6f}, {j.upper:.6f}] {unit}")
+
+
+def report_propagation():
+    """±1σ of a_H^opt, RMSE and HSI from the 3-decimal rounding of the data."""
+    lin = propagate_linearized()
+    mc = summarize_samples(propagate_sampled(n_draws=1_000_000))
+
+    print("\n±1σ from observational rounding (linearized | 10^6 draws):")
+    for key, label, unit in [("a_H_opt", "a_H^opt", "AU"), ("rmse", "Min RMSE", "AU"), ("hsi", "HSI", "%")]:
+        print(f"{label:<9} ±{lin[key].std:.2e} {unit} | ±{mc[key][1]:.2e} {unit}")
+
+
+@profiled("srhf_harmonia_optimisation")
+def main(out_dir=".", uncertainty=False):
+    """Render Figure 3a into out_dir; returns the output paths."""
+    # =====================================================
+    # Optimisation sweep
+    # =====================================================
+    curves = sweep(2.12, 2.18, 1000)
+    a_H_range = curves["a_H"]
+    rmses = curves["rmse"]
+
+    optimal_a_H, min_rmse, _ = rmse_optimum()
+
+    # SRHF comparison values
+    srhf_algebraic = (2*A*C) / (1 + A)
+    srhf_transcendental = np.pi**(2/3)
+
+    # --- Figure data (written only when $SRHF_DATA_DIR is set) ---
+    save_dataset("srhf_harmonia_optimisation_sweep", "sweep", sweep_columns(curves))
+    save_dataset("srhf_harmonia_optimisation_candidates", "candidates",
+                 candidate_columns({"opt": optimal_a_H, "silver": srhf_algebraic,
+                                    "pi": srhf_transcendental}))
+
+    # =====================================================
+    # Print summary
+    # =====================================================
+    print("\n=== SRHF Harmonia Optimisation Results ===")
+    print(f"Optimal a_H (empirical):                 {optimal_a_H:.9f} AU")
+    print(f"SRHF algebraic prediction a_H^Silver:    {srhf_algebraic:.9f} AU")
+    print(f"SRHF transcendental prediction a_H^π:    {srhf_transcendental:.9f} AU")
+    print(f"Minimum RMSE:                            {min_rmse:.9f} AU")
+
+    # Predictions with empirical optimum
+    preds_opt = predict_outer(optimal_a_H)
+
+    print("\nPredicted outer planets at optimum:")
+    for name, pred, obs in zip(planet_names, preds_opt, observeds):
+        print(f"{name:<8}: {pred:.3f} AU   (obs: {obs:.3f} AU)")
+
+    # =====================================================
+    # Plot Harmonia optimisation curve
+    # =====================================================
+
+    use()
+    fig, ax = plt.subplots(figsize=(9, 6.5))
+
+    # Background color, light grey grid behind all elements
+    style_axes(fig, ax)
+
+    ax.plot(a_H_range, rmses, color=INDIGO, linewidth=2, label=r"RMSE vs $a_H$")
+
+    # Empirical optimum
+    ax.axvline(
+        optimal_a_H, color=CRIMSON, linestyle='--', linewidth=2,
+        label=rf"$a_H^{{\mathrm{{opt}}}} = {optimal_a_H:.6f}\,$AU"
+    )
+
+    # SRHF transcendental prediction
+    ax.axvline(
+        srhf_transcendental, color=TEAL, linestyle=':', linewidth=2,
+        label=rf"$a_H^{{\pi}} = {srhf_transcendental:.6f}\,$AU"
+    )
+
+    # SRHF algebraic prediction
+    ax.axvline(
+        srhf_algebraic, color=SRHF_ALGEBRAIC, linestyle='-.', linewidth=2,
+        label=rf"$a_H^{{\mathrm{{Silver}}}} = {srhf_algebraic:.6f}\,$AU"
+    )
+
+    ax.set_xlabel(XLABEL_A_H, fontsize=12)
+    ax.set_ylabel("Root Mean Square Error (AU)", fontsize=12)
+    ax.set_title("SRHF Harmonic Model – Optimisation of Harmonia's Position", fontsize=14)
+    ax.legend(fontsize=9)
+
+    plt.tight_layout()
+    paths = export_figure(plt.gcf(), "srhf_harmonia_optimisation", out_dir, bbox_inches='tight')
+
+    # =====================================================
+    # Differences from optimum
+    # =====================================================
+    print("\nDifferences from empirical optimum:")
+    print(f"Transcendental |a_H^π - a_H^opt|: {abs(srhf_transcendental - optimal_a_H):.6f} AU "
+          f"({abs(srhf_transcendental - optimal_a_H) / optimal_a_H * 100:.3f}%)")
+
+    print(f"Algebraic      |a_H^Silver - a_H^opt|: {abs(srhf_algebraic - optimal_a_H):.6f} AU "
+          f"({abs(srhf_algebraic - optimal_a_H) / optimal_a_H * 100:.3f}%)")
+
+    # =====================================================
+    # Uncertainty of the empirical optimum (--uncertainty):
+    # resampling planets, propagated 3-decimal rounding
+    # =====================================================
+    if uncertainty:
+        report_resampling()
+        report_propagation()
+
+    return show_or_close(paths)
+
+
+if __name__ == "__main__":
+    main(uncertainty="--uncertainty" in sys.argv[1:])
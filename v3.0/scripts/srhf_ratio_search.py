@@ -0,0 +1,18 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Ratio-expression search over {A, B, C, D, π, small rationals}
+# Console output: ranked best-fitting expressions per planet ratio
+# =====================================================
+
+from srhf import search_ratios, format_table
+
+# --- Search settings ---
+DEPTH         = 4      # maximum number of + − × ÷ operations
+MAX_ERROR_PCT = 1.0    # prune anything further than this from the observed ratio
+TOP           = 10     # matches reported per ratio
+
+if __name__ == "__main__":
+    results = search_ratios(depth=DEPTH, max_error_pct=MAX_ERROR_PCT, top=TOP)
+
+    print(f"\n=== SRHF ratio-expression search (depth ≤ {DEPTH}, |dev| ≤ {MAX_ERROR_PCT}%) ===\n")
+    print(format_table(results))
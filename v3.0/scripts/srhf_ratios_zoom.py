@@ -4,79 +4,84 @@
 # =====================================================
 
 import numpy as np
-import matplotlib.pyplot as plt
+from srhf.plotting import plt, show_or_close
+from srhf.export import export_figure
+from srhf.profiling import profiled
+from srhf.style import INDIGO, CRIMSON, BG, style_axes, use
+from srhf.data import save_dataset, ladder_columns, concat_columns
 
-planets = ["Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
 
-# Observed semi-major axes (AU) – consistent with the paper
-observed = np.array([1.524, 5.204, 9.559, 19.185, 30.156, 39.482])
+@profiled("srhf_ratios_zoom")
+def main(out_dir="."):
+    """Render Figure 6b into out_dir; returns the output paths."""
+    planets = ["Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
 
-# Predicted semi-major axes (AU)
-# 1) SRHF algebraic prediction (Silver-ratio-based, from Table 1)
-pred_srhf = np.array([1.547, 5.172, 9.456, 18.912, 30.142, 39.598])
+    # Observed semi-major axes (AU) – consistent with the paper
+    observed = np.array([1.524, 5.204, 9.559, 19.185, 30.156, 39.482])
 
-# 2) Empirically optimised SRHF prediction (using a_H^opt)
-#    These values reflect the tuned Harmonia node a_H^{opt} = 2.1437 AU
-pred_opt = np.array([1.547, 5.175, 9.463, 18.925, 30.164, 39.627])
+    # Predicted semi-major axes (AU)
+    # 1) SRHF algebraic prediction (Silver-ratio-based, from Table 1)
+    pred_srhf = np.array([1.547, 5.172, 9.456, 18.912, 30.142, 39.598])
 
-# Ratios observed/predicted
-ratio_srhf = observed / pred_srhf
-ratio_opt  = observed / pred_opt
+    # 2) Empirically optimised SRHF prediction (using a_H^opt)
+    #    These values reflect the tuned Harmonia node a_H^{opt} = 2.1437 AU
+    pred_opt = np.array([1.547, 5.175, 9.463, 18.925, 30.164, 39.627])
 
-# =====================================================
-# Colours (SRHF palette)
-# =====================================================
-indigo = "#2B2F8A"        # SRHF algebraic predictions
-crimson = "#B22222"       # Empirical optimum
-
-# --- Plot setup ---
-fig, ax = plt.subplots(figsize=(10, 6))
-
-# Background and grid color 
-bg = "#f8f8f8"
-grid_color = "#e0e0e0"
-ax.set_facecolor(bg)
-fig.patch.set_facecolor(bg)
-
-# Background and grid styling
-ax.set_facecolor(bg)
-fig.patch.set_facecolor(bg)
-ax.set_axisbelow(True)
-ax.grid(True, color=grid_color, linewidth=1.0, alpha=0.85)
-
-# SRHF algebraic prediction
-ax.plot(
-    planets, ratio_srhf, 'o-',
-    color=indigo,
-    linewidth=2,
-    markersize=6,
-    label="SRHF harmonic model (algebraic)"
-)
-
-# Empirical optimum 
-ax.plot(
-    planets, ratio_opt, 's--',
-    color=crimson,
-    linewidth=2,
-    markersize=5,
-    label="SRHF harmonic model (empirical optimum)"
-)
-
-# Reference line at ratio = 1
-ax.axhline(1.0, color="gray", linestyle=":", linewidth=1)
-
-# Formatting
-ax.set_ylim(0.985, 1.015)
-ax.set_ylabel("Observed / Predicted ratio", fontsize=12)
-ax.set_xlabel("Planet", fontsize=12)
-ax.set_title(
-    "SRHF Harmonic Model: Observed/Predicted Ratios (Mars–Pluto)",
-    fontsize=13,
-    pad=15
-)
-ax.legend(fontsize=10, loc="upper left")
-
-# Save figure
-plt.tight_layout()
-plt.savefig("srhf_ratios_zoom.png", dpi=300, bbox_inches='tight', facecolor=bg)
-plt.show()
\ No newline at end of file
+    # Ratios observed/predicted
+    ratio_srhf = observed / pred_srhf
+    ratio_opt  = observed / pred_opt
+
+    # --- Figure data (written only when $SRHF_DATA_DIR is set) ---
+    save_dataset("srhf_ratios_zoom_ladder", "ladder", concat_columns(
+        ladder_columns(planets, observed, pred_srhf, "srhf"),
+        ladder_columns(planets, observed, pred_opt, "opt"),
+    ))
+
+    # --- Plot setup ---
+    use()
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # Background and grid styling
+    style_axes(fig, ax)
+
+    # SRHF algebraic prediction
+    ax.plot(
+        planets, ratio_srhf, 'o-',
+        color=INDIGO,
+        linewidth=2,
+        markersize=6,
+        label="SRHF harmonic model (algebraic)"
+    )
+
+    # Empirical optimum 
+    ax.plot(
+        planets, ratio_opt, 's--',
+        color=CRIMSON,
+        linewidth=2,
+        markersize=5,
+        label="SRHF harmonic model (empirical optimum)"
+    )
+
+    # Reference line at ratio = 1
+    ax.axhline(1.0, color="gray", linestyle=":", linewidth=1)
+
+    # Formatting
+    ax.set_ylim(0.985, 1.015)
+    ax.set_ylabel("Observed / Predicted ratio", fontsize=12)
+    ax.set_xlabel("Planet", fontsize=12)
+    ax.set_title(
+        "SRHF Harmonic Model: Observed/Predicted Ratios (Mars–Pluto)",
+        fontsize=13,
+        pad=15
+    )
+    ax.legend(fontsize=10, loc="upper left")
+
+    # Save figure
+    plt.tight_layout()
+    paths = export_figure(plt.gcf(), "srhf_ratios_zoom", out_dir, bbox_inches='tight', facecolor=BG)
+
+    return show_or_close(paths)
+
+
+if __name__ == "__main__":
+    main()
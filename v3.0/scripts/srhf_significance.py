@@ -0,0 +1,25 @@
+# =====================================================
+# Silver-Ratio Harmonic Framework (SRHF)
+# Monte Carlo significance of the outer-system MAPE
+# Console output: running p-value with 95% Clopper–Pearson bounds
+# =====================================================
+
+from srhf import reference_metrics, run_monte_carlo
+
+# --- Monte Carlo settings ---
+N_TRIALS   = 10_000_000
+NULL_MODEL = "ladders"     # "ladders" (random ratio ladders) or "perturbed"
+METRIC     = "mape"        # "mape", "rmse" or "hsi"
+SEED       = 2026
+
+if __name__ == "__main__":
+    reference = reference_metrics()[METRIC]
+    print(f"\n=== SRHF Monte Carlo significance ({NULL_MODEL}, {METRIC}) ===")
+    print(f"SRHF outer-system {METRIC.upper()} (Harmonia–Pluto, "
+          f"celtic_full_system_verification.py): {reference:.6f}")
+    print(f"\n{'Trials':>12} {'Hits':>8} {'p-value':>12} {'95% CI':>26}")
+    print("-" * 62)
+
+    for est in run_monte_carlo(N_TRIALS, null=NULL_MODEL, metric=METRIC, seed=SEED):
+        print(f"{est.trials:12d} {est.hits:8d} {est.p_value:12.3e} "
+              f"[{est.lower:.3e}, {est.upper:.3e}]")